@@ -33,6 +33,33 @@ func NewClient(baseURL string, recognitionKey string, detectionKey string, verif
 	}
 }
 
+// multipartOverhead is a generous upper bound on the multipart headers and
+// boundaries wrapped around a single file part.
+const multipartOverhead = 512
+
+// newMultipartFileBody builds a multipart/form-data body with a single "file"
+// part. The buffer is sized up front so large images are copied exactly once
+// instead of repeatedly as the buffer grows.
+func newMultipartFileBody(filename string, data []byte) (*bytes.Buffer, string, error) {
+	body := bytes.NewBuffer(make([]byte, 0, len(data)+len(filename)+multipartOverhead))
+	writer := multipart.NewWriter(body)
+
+	part, err := writer.CreateFormFile("file", filename)
+	if err != nil {
+		return nil, "", fmt.Errorf("failed to create form file: %w", err)
+	}
+
+	if _, err := part.Write(data); err != nil {
+		return nil, "", fmt.Errorf("failed to write image data: %w", err)
+	}
+
+	if err := writer.Close(); err != nil {
+		return nil, "", fmt.Errorf("failed to close writer: %w", err)
+	}
+
+	return body, writer.FormDataContentType(), nil
+}
+
 // DetectFaces detects faces in an image file
 // POST /api/v1/detection/detect
 func (c *Client) DetectFaces(imagePath string) (*DetectionResponse, error) {
@@ -45,22 +72,9 @@ func (c *Client) DetectFaces(imagePath string) (*DetectionResponse, error) {
 	}
 
 	// Create multipart form
-	body := &bytes.Buffer{}
-	writer := multipart.NewWriter(body)
-
-	part, err := writer.CreateFormFile("file", filepath.Base(imagePath))
-	if err != nil {
-		return nil, fmt.Errorf("failed to create form file: %w", err)
-	}
-
-	_, err = part.Write(imageData)
-	if err != nil {
-		return nil, fmt.Errorf("failed to write image data: %w", err)
-	}
-
-	err = writer.Close()
+	body, contentType, err := newMultipartFileBody(filepath.Base(imagePath), imageData)
 	if err != nil {
-		return nil, fmt.Errorf("failed to close writer: %w", err)
+		return nil, err
 	}
 
 	// Create request
@@ -69,7 +83,7 @@ func (c *Client) DetectFaces(imagePath string) (*DetectionResponse, error) {
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
 
-	req.Header.Set("Content-Type", writer.FormDataContentType())
+	req.Header.Set("Content-Type", contentType)
 	req.Header.Set("x-api-key", c.DetectionKey)
 
 	// Send request
@@ -107,22 +121,9 @@ func (c *Client) DetectFacesFromBytes(imageBytes []byte, filename string) (*Dete
 	url := fmt.Sprintf("%s/api/v1/detection/detect", c.BaseURL)
 
 	// Create multipart form
-	body := &bytes.Buffer{}
-	writer := multipart.NewWriter(body)
-
-	part, err := writer.CreateFormFile("file", filename)
+	body, contentType, err := newMultipartFileBody(filename, imageBytes)
 	if err != nil {
-		return nil, fmt.Errorf("failed to create form file: %w", err)
-	}
-
-	_, err = part.Write(imageBytes)
-	if err != nil {
-		return nil, fmt.Errorf("failed to write image data: %w", err)
-	}
-
-	err = writer.Close()
-	if err != nil {
-		return nil, fmt.Errorf("failed to close writer: %w", err)
+		return nil, err
 	}
 
 	// Create request
@@ -131,7 +132,7 @@ func (c *Client) DetectFacesFromBytes(imageBytes []byte, filename string) (*Dete
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
 
-	req.Header.Set("Content-Type", writer.FormDataContentType())
+	req.Header.Set("Content-Type", contentType)
 	req.Header.Set("x-api-key", c.DetectionKey)
 
 	// Send request
@@ -186,22 +187,9 @@ func (c *Client) RecognizeFacesFromBytes(imageBytes []byte, filename string) (*R
 	url := fmt.Sprintf("%s/api/v1/recognition/recognize?face_plugins=%s", c.BaseURL, url.QueryEscape(pluginArgs))
 
 	// Create multipart form
-	body := &bytes.Buffer{}
-	writer := multipart.NewWriter(body)
-
-	part, err := writer.CreateFormFile("file", filename)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create form file: %w", err)
-	}
-
-	_, err = part.Write(imageBytes)
+	body, contentType, err := newMultipartFileBody(filename, imageBytes)
 	if err != nil {
-		return nil, fmt.Errorf("failed to write image data: %w", err)
-	}
-
-	err = writer.Close()
-	if err != nil {
-		return nil, fmt.Errorf("failed to close writer: %w", err)
+		return nil, err
 	}
 
 	// Create request
@@ -210,7 +198,7 @@ func (c *Client) RecognizeFacesFromBytes(imageBytes []byte, filename string) (*R
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
 
-	req.Header.Set("Content-Type", writer.FormDataContentType())
+	req.Header.Set("Content-Type", contentType)
 	req.Header.Set("x-api-key", c.RecognitionKey)
 
 	// Send request
@@ -259,22 +247,9 @@ func (c *Client) AddSubjectFromBytes(subjectName string, imageBytes []byte, file
 	reqURL := fmt.Sprintf("%s/api/v1/recognition/faces?subject=%s", c.BaseURL, url.QueryEscape(subjectName))
 
 	// Create multipart form
-	body := &bytes.Buffer{}
-	writer := multipart.NewWriter(body)
-
-	part, err := writer.CreateFormFile("file", filename)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create form file: %w", err)
-	}
-
-	_, err = part.Write(imageBytes)
-	if err != nil {
-		return nil, fmt.Errorf("failed to write image data: %w", err)
-	}
-
-	err = writer.Close()
+	body, contentType, err := newMultipartFileBody(filename, imageBytes)
 	if err != nil {
-		return nil, fmt.Errorf("failed to close writer: %w", err)
+		return nil, err
 	}
 
 	// Create request
@@ -283,7 +258,7 @@ func (c *Client) AddSubjectFromBytes(subjectName string, imageBytes []byte, file
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
 
-	req.Header.Set("Content-Type", writer.FormDataContentType())
+	req.Header.Set("Content-Type", contentType)
 	req.Header.Set("x-api-key", c.RecognitionKey)
 
 	// Send request
@@ -20,6 +20,8 @@ func Load(input common.PluginInput) (*PluginConfig, error) {
 		// Default values
 		CooldownSeconds:            10,
 		MaxBatchSize:               20,
+		MaxConcurrentImages:        1,
+		MaxConcurrentFaces:         1,
 		MinSimilarity:              0.81,
 		MinFaceSize:                64,
 		MinConfidenceScore:         0.7,
@@ -27,6 +29,7 @@ func Load(input common.PluginInput) (*PluginConfig, error) {
 		MinProcessingQualityScore:  0, // 0 = use component gates (size, pose, occlusion)
 		EnhanceQualityScoreTrigger: 0.5,
 		EnableEmbeddingRecognition: false, // Embedding recognition disabled by default due to Compreface format incompatibility
+		DetectorBackend:            DetectorAuto,
 		ScannedTagName:             "Compreface Scanned",
 		MatchedTagName:             "Compreface Matched",
 		PartialTagName:             "Compreface Partial",
@@ -59,6 +62,12 @@ func Load(input common.PluginInput) (*PluginConfig, error) {
 		if val := getIntSetting(pluginConfig, "maxBatchSize"); val > 0 {
 			config.MaxBatchSize = val
 		}
+		if val := getIntSetting(pluginConfig, "maxConcurrentImages"); val > 0 {
+			config.MaxConcurrentImages = val
+		}
+		if val := getIntSetting(pluginConfig, "maxConcurrentFaces"); val > 0 {
+			config.MaxConcurrentFaces = val
+		}
 		if val := getFloatSetting(pluginConfig, "minSimilarity"); val > 0 {
 			config.MinSimilarity = val
 		}
@@ -74,6 +83,9 @@ func Load(input common.PluginInput) (*PluginConfig, error) {
 		if val := getFloatSetting(pluginConfig, "minProcessingQualityScore"); val > 0 {
 			config.MinProcessingQualityScore = val
 		}
+		if val := getFloatSetting(pluginConfig, "enhanceQualityScoreTrigger"); val > 0 {
+			config.EnhanceQualityScoreTrigger = val
+		}
 		if val := getStringSetting(pluginConfig, "scannedTagName"); val != "" {
 			config.ScannedTagName = val
 		}
@@ -89,6 +101,14 @@ func Load(input common.PluginInput) (*PluginConfig, error) {
 		if val := getStringSetting(pluginConfig, "stashHostUrl"); val != "" {
 			config.StashHostURL = val
 		}
+		if val := getStringSetting(pluginConfig, "detectorBackend"); val != "" {
+			switch backend := strings.ToLower(strings.TrimSpace(val)); backend {
+			case DetectorAuto, DetectorVision, DetectorCompreface:
+				config.DetectorBackend = backend
+			default:
+				log.Warnf("Unknown detector backend %q, using %q", val, DetectorAuto)
+			}
+		}
 	}
 
 	// Resolve Compreface URL with auto-detection
@@ -123,8 +143,11 @@ func Load(input common.PluginInput) (*PluginConfig, error) {
 	if config.RecognitionAPIKey == "" {
 		return nil, fmt.Errorf("recognition API key is required")
 	}
+	// The detection API key is optional: recognition uses the recognition service,
+	// which runs its own detector, so the detection service is never called by the
+	// plugin's tasks.
 	if config.DetectionAPIKey == "" {
-		return nil, fmt.Errorf("detection API key is required")
+		log.Debug("Detection API key not configured (not required)")
 	}
 
 	return config, nil
@@ -0,0 +1,34 @@
+package config
+
+import (
+	"bytes"
+	"fmt"
+	"io"
+	"net/http"
+)
+
+// MaxDownloadBytes caps the size of any HTTP response body read into memory:
+// images, sprite sheets, VTT files and extracted video frames
+const MaxDownloadBytes = 64 << 20
+
+// ReadLimitedBody reads an HTTP response body, failing when it exceeds
+// MaxDownloadBytes. A Content-Length over the limit is rejected before reading;
+// otherwise the buffer is sized from Content-Length when known.
+func ReadLimitedBody(resp *http.Response) ([]byte, error) {
+	if resp.ContentLength > MaxDownloadBytes {
+		return nil, fmt.Errorf("response too large: %d bytes exceeds %d", resp.ContentLength, MaxDownloadBytes)
+	}
+
+	var buf bytes.Buffer
+	if resp.ContentLength > 0 {
+		buf.Grow(int(resp.ContentLength) + bytes.MinRead)
+	}
+	if _, err := buf.ReadFrom(io.LimitReader(resp.Body, MaxDownloadBytes+1)); err != nil {
+		return nil, err
+	}
+	if buf.Len() > MaxDownloadBytes {
+		return nil, fmt.Errorf("response too large: exceeds %d bytes", MaxDownloadBytes)
+	}
+
+	return buf.Bytes(), nil
+}
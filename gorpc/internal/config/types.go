@@ -1,5 +1,12 @@
 package config
 
+// Face detector backends for image identification
+const (
+	DetectorAuto       = "auto"       // Vision Service when healthy, Compreface otherwise
+	DetectorVision     = "vision"     // Vision Service only
+	DetectorCompreface = "compreface" // Compreface's built-in detector only
+)
+
 // PluginConfig holds plugin settings from Stash
 type PluginConfig struct {
 	ComprefaceURL                  string
@@ -11,6 +18,8 @@ type PluginConfig struct {
 	StashHostURL                   string
 	CooldownSeconds                int
 	MaxBatchSize                   int
+	MaxConcurrentImages            int // Images processed in parallel within a batch (default: 1)
+	MaxConcurrentFaces             int // Faces processed in parallel within an image or scene (default: 1)
 	MinSimilarity                  float64
 	MinFaceSize                    int
 	MinConfidenceScore        float64 // Minimum confidence score for face detection
@@ -18,6 +27,7 @@ type PluginConfig struct {
 	MinProcessingQualityScore float64 // Minimum composite quality for recognition (0=use component gates)
 	EnhanceQualityScoreTrigger     float64 // Quality score threshold to trigger enhancement
 	EnableEmbeddingRecognition     bool    // Enable embedding-based recognition (default: false, requires compatible embeddings)
+	DetectorBackend                string  // Face detector for image identification: auto, vision or compreface (default: auto)
 	ScannedTagName                 string
 	MatchedTagName                 string
 	PartialTagName                 string
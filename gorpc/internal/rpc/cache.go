@@ -0,0 +1,112 @@
+package rpc
+
+import (
+	"image"
+	"sync"
+)
+
+// frameCacheSize is the number of decoded video frames kept per scene
+const frameCacheSize = 8
+
+// FrameKey identifies an extracted video frame
+type FrameKey struct {
+	VideoPath string
+	Timestamp float64
+	Enhanced  bool
+}
+
+// frameLoad is an in-flight frame extraction shared by concurrent callers
+type frameLoad struct {
+	done  chan struct{}
+	frame image.Image
+	err   error
+}
+
+// FrameCache provides a thread-safe, bounded cache of decoded video frames.
+// Faces of one scene often share a representative timestamp, so caching avoids
+// extracting and decoding the same frame once per face. A cache is scoped to a
+// single scene so frames are released once the scene is done. When full, the
+// oldest entry is evicted.
+type FrameCache struct {
+	frames   map[FrameKey]image.Image
+	loading  map[FrameKey]*frameLoad
+	order    []FrameKey
+	capacity int
+	mu       sync.RWMutex
+}
+
+// NewFrameCache creates a new frame cache holding at most capacity frames
+func NewFrameCache(capacity int) *FrameCache {
+	return &FrameCache{
+		frames:   make(map[FrameKey]image.Image, capacity),
+		loading:  make(map[FrameKey]*frameLoad),
+		capacity: capacity,
+	}
+}
+
+// GetOrLoad returns the cached frame for key, calling load on a miss.
+// Concurrent misses on the same key share a single load. Failed loads are not
+// cached.
+func (fc *FrameCache) GetOrLoad(key FrameKey, load func() (image.Image, error)) (image.Image, error) {
+	fc.mu.Lock()
+	if frame, ok := fc.frames[key]; ok {
+		fc.mu.Unlock()
+		return frame, nil
+	}
+	if pending, ok := fc.loading[key]; ok {
+		fc.mu.Unlock()
+		<-pending.done
+		return pending.frame, pending.err
+	}
+	pending := &frameLoad{done: make(chan struct{})}
+	fc.loading[key] = pending
+	fc.mu.Unlock()
+
+	pending.frame, pending.err = load()
+
+	fc.mu.Lock()
+	delete(fc.loading, key)
+	if pending.err == nil {
+		fc.set(key, pending.frame)
+	}
+	fc.mu.Unlock()
+	close(pending.done)
+
+	return pending.frame, pending.err
+}
+
+// Get retrieves a cached frame
+func (fc *FrameCache) Get(key FrameKey) (image.Image, bool) {
+	fc.mu.RLock()
+	defer fc.mu.RUnlock()
+	frame, ok := fc.frames[key]
+	return frame, ok
+}
+
+// Set stores a frame in the cache, evicting the oldest frame when full
+func (fc *FrameCache) Set(key FrameKey, frame image.Image) {
+	fc.mu.Lock()
+	defer fc.mu.Unlock()
+	fc.set(key, frame)
+}
+
+// set stores a frame; the caller must hold fc.mu
+func (fc *FrameCache) set(key FrameKey, frame image.Image) {
+	if fc.capacity <= 0 {
+		return
+	}
+
+	if _, ok := fc.frames[key]; ok {
+		fc.frames[key] = frame
+		return
+	}
+
+	if len(fc.order) >= fc.capacity {
+		oldest := fc.order[0]
+		fc.order = fc.order[1:]
+		delete(fc.frames, oldest)
+	}
+
+	fc.frames[key] = frame
+	fc.order = append(fc.order, key)
+}
@@ -4,6 +4,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"strconv"
+	"sync"
 
 	"github.com/stashapp/stash/pkg/plugin/common"
 	"github.com/stashapp/stash/pkg/plugin/common/log"
@@ -19,6 +20,9 @@ func (s *Service) Run(input common.PluginInput, output *common.PluginOutput) err
 	s.serverConnection = input.ServerConnection
 	s.graphqlClient = stash.Client(input.ServerConnection)
 	s.tagCache = stash.NewTagCache()
+	s.visionOnce = new(sync.Once)
+	s.visionClient = nil
+	s.visionClientErr = nil
 
 	// Load plugin configuration
 	cfg, err := config.Load(input)
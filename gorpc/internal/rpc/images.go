@@ -7,18 +7,22 @@ import (
 	"fmt"
 	"image"
 	_ "image/gif" // Register GIF format
-	"image/jpeg"
 	_ "image/png" // Register PNG format
+	"math"
 	"os"
+	"path/filepath"
 	"strings"
+	"sync"
 
 	_ "golang.org/x/image/bmp"  // Register BMP format
 	_ "golang.org/x/image/webp" // Register WEBP format
 
+	"github.com/disintegration/imaging"
 	graphql "github.com/hasura/go-graphql-client"
 	"github.com/stashapp/stash/pkg/plugin/common/log"
 
 	"github.com/smegmarip/stash-compreface-plugin/internal/compreface"
+	"github.com/smegmarip/stash-compreface-plugin/internal/config"
 	"github.com/smegmarip/stash-compreface-plugin/internal/stash"
 	"github.com/smegmarip/stash-compreface-plugin/internal/vision"
 	"github.com/smegmarip/stash-compreface-plugin/pkg/utils"
@@ -28,6 +32,11 @@ import (
 // Image Business Logic (Service Layer)
 // ============================================================================
 
+// comprefaceMaxImageEdge caps the longest edge (in pixels) of images submitted
+// to the Compreface detector. Larger images are downscaled before detection and
+// the returned face boxes are mapped back to source image coordinates.
+const comprefaceMaxImageEdge = 1920
+
 // recognizeImages performs batch face recognition on images using Vision Service
 func (s *Service) recognizeImages(limit int) error {
 	if s.stopping {
@@ -39,13 +48,11 @@ func (s *Service) recognizeImages(limit int) error {
 		return fmt.Errorf("vision service URL not configured")
 	}
 
-	// Initialize Vision Service client
-	visionClient := vision.NewVisionServiceClient(s.config.VisionServiceURL, s.config.FrameServerURL)
-
-	// Health check
-	if err := visionClient.HealthCheck(); err != nil {
+	// Get the shared Vision Service client (health-checked once per run)
+	visionClient, err := s.getVisionClient()
+	if err != nil {
 		log.Errorf("Health check failed: %v", err)
-		return fmt.Errorf("vision service health check failed: %w", err)
+		return err
 	}
 
 	log.Infof("Starting batch image recognition")
@@ -107,35 +114,43 @@ func (s *Service) recognizeImages(limit int) error {
 
 		log.Infof("Processing batch %d: %d images", page, len(images))
 
-		// Process each image in the batch
-		for _, img := range images {
-			if s.stopping {
-				return fmt.Errorf("operation cancelled")
-			}
+		// Trim the batch to the remaining limit
+		if limit > 0 && processedCount+len(images) > limit {
+			images = images[:limit-processedCount]
+		}
 
-			// Check if limit reached
-			if limit > 0 && processedCount >= limit {
-				log.Infof("Reached limit of %d images, stopping", limit)
-				break
-			}
+		// Process the images in the batch (concurrently when configured)
+		var mu sync.Mutex
+		s.forEachConcurrent(len(images), s.config.MaxConcurrentImages, func(i int) {
+			img := images[i]
 
+			mu.Lock()
 			processedCount++
-			progress := float64(processedCount) / float64(total)
-			log.Progress(progress)
+			current := processedCount
+			log.Progress(float64(current) / float64(total))
+			mu.Unlock()
 
-			log.Infof("Processing image %d/%d: %s", processedCount, total, img.ID)
+			log.Infof("Processing image %d/%d: %s", current, total, img.ID)
 
 			err := s.recognizeImageFaces(visionClient, string(img.ID))
+
+			mu.Lock()
+			defer mu.Unlock()
 			if err != nil {
 				log.Warnf("Failed to recognize faces in image %s: %v", img.ID, err)
 				failureCount++
 			} else {
 				successCount++
 			}
+		})
+
+		if s.stopping {
+			return fmt.Errorf("operation cancelled")
 		}
 
 		// Break outer loop if limit reached
 		if limit > 0 && processedCount >= limit {
+			log.Infof("Reached limit of %d images, stopping", limit)
 			break
 		}
 
@@ -196,10 +211,10 @@ func (s *Service) recognizeImageFaces(visionClient *vision.VisionServiceClient,
 	}
 	log.Infof("Image %s: Found %d processable faces out of %d total faces", imageID, facesDetected, len(results.Faces.Faces))
 
-	// Step 4: Load image bytes for face cropping
-	imageBytes, err := LoadImageBytes(imagePath)
+	// Step 4: Decode image once for face cropping (shared by every face)
+	sourceImg, err := LoadImage(imagePath)
 	if err != nil {
-		return fmt.Errorf("failed to load image bytes: %w", err)
+		return fmt.Errorf("failed to load image: %w", err)
 	}
 
 	// Step 5: Process each face
@@ -207,16 +222,25 @@ func (s *Service) recognizeImageFaces(visionClient *vision.VisionServiceClient,
 	matchedPerformers := []graphql.ID{}
 	facesProcessed := 0
 
-	for _, face := range results.Faces.Faces {
+	// Faces are processed concurrently when configured; results keep face order.
+	// processFace serializes subject creation, so two faces of one person that
+	// Vision clustered apart cannot each create a new subject.
+	faces := results.Faces.Faces
+	performerIDs := make([]graphql.ID, len(faces))
+	s.forEachConcurrent(len(faces), s.config.MaxConcurrentFaces, func(i int) {
 		ctx := FaceProcessingContext{
-			ImageBytes: imageBytes,
-			SourceID:   imageID,
+			Image:    sourceImg,
+			SourceID: imageID,
 		}
-		performerID, err := s.processFace(visionClient, ctx, face, requestMetadata)
+		performerID, err := s.processFace(visionClient, ctx, faces[i], requestMetadata)
 		if err != nil {
-			log.Warnf("Failed to process face %s: %v", face.FaceID, err)
-			continue
+			log.Warnf("Failed to process face %s: %v", faces[i].FaceID, err)
+			return
 		}
+		performerIDs[i] = performerID
+	})
+
+	for _, performerID := range performerIDs {
 		if performerID != "" {
 			matchedPerformers = append(matchedPerformers, performerID)
 			facesProcessed++
@@ -296,13 +320,27 @@ func (s *Service) identifyImage(imageID string, createPerformer bool, associateE
 	var facesToProcess []compreface.RecognitionResult
 	var facesDetected int
 
-	// Check if Vision Service is available
-	visionClient := s.createVisionClient()
+	// Select the face detector backend
+	var visionClient *vision.VisionServiceClient
+	switch s.config.DetectorBackend {
+	case config.DetectorCompreface:
+		log.Debugf("Detector backend is %s, skipping Vision Service", config.DetectorCompreface)
+	case config.DetectorVision:
+		visionClient, err = s.getVisionClient()
+		if err != nil {
+			return nil, fmt.Errorf("vision detector backend unavailable: %w", err)
+		}
+	default:
+		visionClient = s.createVisionClient()
+	}
+
 	if visionClient != nil {
 		// VISION SERVICE PATH (preferred)
 		log.Infof("Using Vision Service for face detection: %s", imagePath)
 		visionIdentities, visionFacesDetected, visionErr := s.identifyImageViaVision(visionClient, imageID, imagePath, createPerformer, faceIndex)
-		if visionErr != nil {
+		if visionErr != nil && s.config.DetectorBackend == config.DetectorVision {
+			return nil, fmt.Errorf("vision service identification failed: %w", visionErr)
+		} else if visionErr != nil {
 			log.Warnf("Vision Service identification failed, falling back to Compreface: %v", visionErr)
 		} else {
 			identities = visionIdentities
@@ -420,27 +458,26 @@ handleAssociation:
 	return identities, nil
 }
 
-// createVisionClient initializes and returns a Vision Service client if available
+// createVisionClient returns the shared Vision Service client if it is configured
+// and healthy, or nil when callers should fall back to the Compreface detector.
 func (s *Service) createVisionClient() *vision.VisionServiceClient {
-	if s.config.VisionServiceURL != "" {
-		visionClient := vision.NewVisionServiceClient(s.config.VisionServiceURL, s.config.FrameServerURL)
-		if healthErr := visionClient.HealthCheck(); healthErr == nil {
-			// VISION SERVICE PATH (preferred)
-			log.Infof("Vision Service is available.")
-			return visionClient
-		} else {
-			log.Warnf("Vision Service unavailable, falling back to Compreface: %v", healthErr)
-		}
-	} else {
+	if s.config.VisionServiceURL == "" {
 		log.Warnf("Vision Service not configured, using Compreface detector (inferior quality)")
+		return nil
 	}
-	return nil
+
+	visionClient, err := s.getVisionClient()
+	if err != nil {
+		log.Warnf("Vision Service unavailable, falling back to Compreface: %v", err)
+		return nil
+	}
+	return visionClient
 }
 
 // processComprefaceRecognition processes face recognition using Compreface for a single image.
 func (s *Service) processComprefaceRecognition(imageID string, imagePath string) (*compreface.RecognitionResponse, error) {
 	log.Infof("Recognizing faces in image using Compreface: %s", imagePath)
-	recognitionResp, err := s.comprefaceClient.RecognizeFaces(imagePath)
+	recognitionResp, err := s.recognizeFacesScaled(imagePath)
 	if err != nil {
 		// Check if error is "No face is found" (code 28)
 		if strings.Contains(err.Error(), "No face is found") || strings.Contains(err.Error(), "code\" : 28") {
@@ -471,6 +508,59 @@ func (s *Service) processComprefaceRecognition(imageID string, imagePath string)
 	return recognitionResp, nil
 }
 
+// recognizeFacesScaled runs Compreface recognition on an image file, downscaling it
+// first when its longest edge exceeds comprefaceMaxImageEdge. Detection cost grows
+// with pixel count, so oversized images are shrunk (area averaging) and the face
+// boxes in the response are scaled back to source image coordinates.
+func (s *Service) recognizeFacesScaled(imagePath string) (*compreface.RecognitionResponse, error) {
+	imageBytes, err := os.ReadFile(imagePath)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read image file: %w", err)
+	}
+	filename := filepath.Base(imagePath)
+
+	// Read dimensions from the header only; small or unrecognized images are sent as-is
+	cfg, _, err := image.DecodeConfig(bytes.NewReader(imageBytes))
+	if err != nil || utils.Max(cfg.Width, cfg.Height) <= comprefaceMaxImageEdge {
+		return s.comprefaceClient.RecognizeFacesFromBytes(imageBytes, filename)
+	}
+	if err := checkImageSize(cfg.Width, cfg.Height); err != nil {
+		return nil, err
+	}
+
+	img, _, err := image.Decode(bytes.NewReader(imageBytes))
+	if err != nil {
+		return nil, fmt.Errorf("failed to decode image: %w", err)
+	}
+
+	scale := float64(comprefaceMaxImageEdge) / float64(utils.Max(cfg.Width, cfg.Height))
+	width := utils.Max(1, int(math.Round(float64(cfg.Width)*scale)))
+	height := utils.Max(1, int(math.Round(float64(cfg.Height)*scale)))
+	resized := imaging.Resize(img, width, height, imaging.Box)
+
+	resizedBytes, err := encodeJPEG(resized, 95)
+	if err != nil {
+		return nil, fmt.Errorf("failed to encode downscaled image: %w", err)
+	}
+
+	log.Debugf("Downscaled %s from %dx%d to %dx%d for Compreface detection",
+		filename, cfg.Width, cfg.Height, width, height)
+
+	recognitionResp, err := s.comprefaceClient.RecognizeFacesFromBytes(resizedBytes, filename)
+	if err != nil {
+		return nil, err
+	}
+
+	// Map face boxes back to source image coordinates
+	scaleX := float64(cfg.Width) / float64(width)
+	scaleY := float64(cfg.Height) / float64(height)
+	for i := range recognitionResp.Result {
+		recognitionResp.Result[i].Box = utils.ScaleBoundingBox(recognitionResp.Result[i].Box, scaleX, scaleY)
+	}
+
+	return recognitionResp, nil
+}
+
 // createComprefaceSubjectFromRecognitionResult creates a new Compreface subject from a recognition result
 func (s *Service) createComprefaceSubjectFromRecognitionResult(
 	subjectName string,
@@ -742,10 +832,10 @@ func (s *Service) identifyImageViaVision(
 		log.Infof("Processing only face index %d", *faceIndex)
 	}
 
-	// Load image bytes for face cropping
-	imageBytes, err := LoadImageBytes(imagePath)
+	// Decode image once for face cropping (shared by every face)
+	sourceImg, err := LoadImage(imagePath)
 	if err != nil {
-		return nil, 0, fmt.Errorf("failed to load image bytes: %w", err)
+		return nil, 0, fmt.Errorf("failed to load image: %w", err)
 	}
 
 	log.Infof("Image %s: Found %d face(s) via Vision Service", imageID, facesDetected)
@@ -753,11 +843,16 @@ func (s *Service) identifyImageViaVision(
 	// Process each detected face
 	identities := &[]FaceIdentity{}
 	ctx := FaceProcessingContext{
-		ImageBytes: imageBytes,
-		SourceID:   imageID,
+		Image:    sourceImg,
+		SourceID: imageID,
 	}
 
-	for i, face := range facesToProcess {
+	// Faces are processed concurrently when configured; results keep face order.
+	// processFaceForIdentification serializes subject creation, so two faces of
+	// one person that Vision clustered apart cannot each create a new subject.
+	faceIdentities := make([]*FaceIdentity, len(facesToProcess))
+	s.forEachConcurrent(len(facesToProcess), s.config.MaxConcurrentFaces, func(i int) {
+		face := facesToProcess[i]
 		log.Debugf("Processing face %d/%d: %s", i+1, len(facesToProcess), face.FaceID)
 
 		identity, err := s.processFaceForIdentification(
@@ -765,9 +860,12 @@ func (s *Service) identifyImageViaVision(
 
 		if err != nil {
 			log.Warnf("Failed to process face %s: %v", face.FaceID, err)
-			continue
+			return
 		}
+		faceIdentities[i] = identity
+	})
 
+	for _, identity := range faceIdentities {
 		if identity != nil {
 			*identities = append(*identities, *identity)
 		}
@@ -923,36 +1021,44 @@ func (s *Service) identifyImages(newOnly bool, limit int) error {
 
 		log.Infof("Processing batch %d: %d images", page, len(images))
 
-		// Process each image in the batch
-		for _, image := range images {
-			if s.stopping {
-				return fmt.Errorf("operation cancelled")
-			}
+		// Trim the batch to the remaining limit
+		if limit > 0 && processedCount+len(images) > limit {
+			images = images[:limit-processedCount]
+		}
 
-			// Check if limit reached
-			if limit > 0 && processedCount >= limit {
-				log.Infof("Reached limit of %d images, stopping", limit)
-				break
-			}
+		// Process the images in the batch (concurrently when configured)
+		var mu sync.Mutex
+		s.forEachConcurrent(len(images), s.config.MaxConcurrentImages, func(i int) {
+			image := images[i]
 
+			mu.Lock()
 			processedCount++
-			progress := float64(processedCount) / float64(total)
-			log.Progress(progress)
+			current := processedCount
+			log.Progress(float64(current) / float64(total))
+			mu.Unlock()
 
-			log.Infof("Processing image %d/%d: %s", processedCount, total, image.ID)
+			log.Infof("Processing image %d/%d: %s", current, total, image.ID)
 
 			// Batch processing always associates performers
 			_, err := s.identifyImage(string(image.ID), false, true, nil)
+
+			mu.Lock()
+			defer mu.Unlock()
 			if err != nil {
 				log.Warnf("Failed to identify image %s: %v", image.ID, err)
 				failureCount++
 			} else {
 				successCount++
 			}
+		})
+
+		if s.stopping {
+			return fmt.Errorf("operation cancelled")
 		}
 
 		// Break outer loop if limit reached
 		if limit > 0 && processedCount >= limit {
+			log.Infof("Reached limit of %d images, stopping", limit)
 			break
 		}
 
@@ -1103,13 +1209,12 @@ func (s *Service) updateImageCompletionStatus(imageID graphql.ID, facesDetected
 
 // convertToJPEG opens an image from disk and ensures it’s in JPEG format.
 func (s *Service) convertToJPEG(imagePath string) (image.Image, error) {
-	file, err := os.Open(imagePath)
+	imageBytes, err := os.ReadFile(imagePath)
 	if err != nil {
 		return nil, err
 	}
-	defer file.Close()
 
-	img, _, err := image.Decode(file)
+	img, _, err := decodeImage(imageBytes)
 	if err != nil {
 		return nil, err
 	}
@@ -1119,8 +1224,17 @@ func (s *Service) convertToJPEG(imagePath string) (image.Image, error) {
 
 // extractBoxImage crops a region from the image with optional padding.
 func (s *Service) extractBoxImage(img image.Image, box compreface.BoundingBox, padding int) (image.Image, error) {
-	bounds := img.Bounds()
+	rect := paddedBoxRect(img.Bounds(), box, padding)
+	cropped := img.(interface {
+		SubImage(r image.Rectangle) image.Image
+	}).SubImage(rect)
 
+	return cropped, nil
+}
+
+// paddedBoxRect returns the crop rectangle used by extractBoxImage: the box
+// expanded by padding (at least 15% of its larger side), clamped to bounds.
+func paddedBoxRect(bounds image.Rectangle, box compreface.BoundingBox, padding int) image.Rectangle {
 	width := box.XMax - box.XMin
 	height := box.YMax - box.YMin
 	maxDim := width
@@ -1138,21 +1252,16 @@ func (s *Service) extractBoxImage(img image.Image, box compreface.BoundingBox, p
 	xMax := utils.Min(bounds.Max.X, box.XMax+padding)
 	yMax := utils.Min(bounds.Max.Y, box.YMax+padding)
 
-	rect := image.Rect(xMin, yMin, xMax, yMax)
-	cropped := img.(interface {
-		SubImage(r image.Rectangle) image.Image
-	}).SubImage(rect)
-
-	return cropped, nil
+	return image.Rect(xMin, yMin, xMax, yMax)
 }
 
 // imageToBase64 encodes the image to JPEG and Base64.
 func (s *Service) convertImageToBase64(img image.Image) (string, error) {
-	buf := new(bytes.Buffer)
-	if err := jpeg.Encode(buf, img, &jpeg.Options{Quality: 90}); err != nil {
+	imageBytes, err := encodeJPEG(img, 90)
+	if err != nil {
 		return "", err
 	}
-	return base64.StdEncoding.EncodeToString(buf.Bytes()), nil
+	return base64.StdEncoding.EncodeToString(imageBytes), nil
 }
 
 // extractBase64FaceImage extracts a face image from the given image path and bounding box,
@@ -1178,7 +1287,7 @@ func (s *Service) extractBase64FaceImage(imagePath string, box compreface.Boundi
 // cropFaceBytes extracts a face region from image bytes and returns JPEG bytes.
 // Used for submitting individual faces to Compreface from multi-face images.
 func (s *Service) cropFaceBytes(imageBytes []byte, box compreface.BoundingBox, padding int) ([]byte, error) {
-	img, _, err := image.Decode(bytes.NewReader(imageBytes))
+	img, _, err := decodeImage(imageBytes)
 	if err != nil {
 		return nil, fmt.Errorf("failed to decode image: %w", err)
 	}
@@ -1188,10 +1297,10 @@ func (s *Service) cropFaceBytes(imageBytes []byte, box compreface.BoundingBox, p
 		return nil, fmt.Errorf("failed to crop face region: %w", err)
 	}
 
-	var buf bytes.Buffer
-	if err := jpeg.Encode(&buf, cropped, &jpeg.Options{Quality: 90}); err != nil {
+	faceBytes, err := encodeJPEG(cropped, 90)
+	if err != nil {
 		return nil, fmt.Errorf("failed to encode cropped face: %w", err)
 	}
 
-	return buf.Bytes(), nil
+	return faceBytes, nil
 }
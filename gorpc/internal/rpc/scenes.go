@@ -18,13 +18,11 @@ func (s *Service) recognizeScenes(useSprites bool, scanPartial bool, limit int)
 		return fmt.Errorf("vision service URL not configured")
 	}
 
-	// Initialize Vision Service client
-	visionClient := vision.NewVisionServiceClient(s.config.VisionServiceURL, s.config.FrameServerURL)
-
-	// Health check
-	if err := visionClient.HealthCheck(); err != nil {
+	// Get the shared Vision Service client (health-checked once per run)
+	visionClient, err := s.getVisionClient()
+	if err != nil {
 		log.Errorf("Health check failed: %v", err)
-		return fmt.Errorf("vision service health check failed: %w", err)
+		return err
 	}
 
 	filterTagName := s.config.ScannedTagName
@@ -225,20 +223,44 @@ func (s *Service) processScene(visionClient *vision.VisionServiceClient, scene s
 	// Get result requestMetadata
 	requestMetadata := results.Faces.Metadata
 
+	// Fetch the sprite sheet once for all faces instead of once per face.
+	// If the fetch fails, faces needing a sprite thumbnail are skipped.
+	var spriteSheet *SpriteSheet
+	if requestMetadata.Method == "sprites" && facesDetected > 0 {
+		spriteVTT := s.NormalizeHost(scene.Paths.VTT)
+		spriteImage := s.NormalizeHost(scene.Paths.Sprite)
+		spriteSheet, err = FetchSpriteSheet(spriteImage, spriteVTT)
+		if err != nil {
+			log.Warnf("Scene %s: Failed to fetch sprite sheet, skipping sprite extraction: %v", scene.ID, err)
+		}
+	}
+
 	// Process each face and track results
 	matchedPerformers := []graphql.ID{}
 	facesProcessed := 0 // Faces that were either matched or created as new subjects
 
-	for _, face := range results.Faces.Faces {
+	// Faces are processed concurrently when configured; results keep face order.
+	// processFace serializes subject creation, so two faces of one person that
+	// Vision clustered apart cannot each create a new subject.
+	faces := results.Faces.Faces
+	frames := NewFrameCache(frameCacheSize)
+	performerIDs := make([]graphql.ID, len(faces))
+	s.forEachConcurrent(len(faces), s.config.MaxConcurrentFaces, func(i int) {
 		ctx := FaceProcessingContext{
 			Scene:    &scene,
+			Sprite:   spriteSheet,
+			Frames:   frames,
 			SourceID: string(scene.ID),
 		}
-		performerID, err := s.processFace(visionClient, ctx, face, requestMetadata)
+		performerID, err := s.processFace(visionClient, ctx, faces[i], requestMetadata)
 		if err != nil {
-			log.Warnf("Failed to process face %s: %v", face.FaceID, err)
-			continue
+			log.Warnf("Failed to process face %s: %v", faces[i].FaceID, err)
+			return
 		}
+		performerIDs[i] = performerID
+	})
+
+	for _, performerID := range performerIDs {
 		if performerID != "" {
 			matchedPerformers = append(matchedPerformers, performerID)
 			facesProcessed++
@@ -1,15 +1,21 @@
 package rpc
 
 import (
+	"fmt"
+	"sync"
 	"time"
 
 	"github.com/stashapp/stash/pkg/plugin/common"
 	"github.com/stashapp/stash/pkg/plugin/common/log"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/vision"
 )
 
 // NewService creates a new RPC service instance
 func NewService() *Service {
-	return &Service{}
+	return &Service{
+		visionOnce: new(sync.Once),
+	}
 }
 
 // Stop handles graceful shutdown of the plugin
@@ -20,6 +26,28 @@ func (s *Service) Stop(input struct{}, output *bool) error {
 	return nil
 }
 
+// getVisionClient returns the Vision Service client for the current run,
+// creating and health-checking it on first use. Later calls reuse the outcome,
+// so batch operations pay for one health check instead of one per item.
+func (s *Service) getVisionClient() (*vision.VisionServiceClient, error) {
+	s.visionOnce.Do(func() {
+		if s.config.VisionServiceURL == "" {
+			s.visionClientErr = fmt.Errorf("vision service URL not configured")
+			return
+		}
+
+		client := vision.NewVisionServiceClient(s.config.VisionServiceURL, s.config.FrameServerURL)
+		if err := client.HealthCheck(); err != nil {
+			s.visionClientErr = fmt.Errorf("vision service health check failed: %w", err)
+			return
+		}
+
+		log.Infof("Vision Service is available.")
+		s.visionClient = client
+	})
+	return s.visionClient, s.visionClientErr
+}
+
 // applyCooldown applies the configured cooldown period
 func (s *Service) applyCooldown() {
 	if s.config.CooldownSeconds > 0 {
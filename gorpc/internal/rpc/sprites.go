@@ -2,18 +2,17 @@ package rpc
 
 import (
 	"bufio"
-	"bytes"
 	"fmt"
 	"image"
-	"image/jpeg"
 	_ "image/png" // Register PNG decoder
-	"io"
 	"net/http"
 	"regexp"
 	"strconv"
 	"strings"
 
 	"github.com/disintegration/imaging"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/config"
 )
 
 // VTTCue represents a single cue in a WebVTT file
@@ -116,7 +115,12 @@ func FetchSpriteImage(url string) (image.Image, error) {
 		return nil, fmt.Errorf("failed to fetch sprite image: status %d", resp.StatusCode)
 	}
 
-	img, _, err := image.Decode(resp.Body)
+	spriteBytes, err := config.ReadLimitedBody(resp)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read sprite image: %w", err)
+	}
+
+	img, _, err := decodeImage(spriteBytes)
 	if err != nil {
 		return nil, fmt.Errorf("failed to decode sprite image: %w", err)
 	}
@@ -136,7 +140,7 @@ func FetchVTT(url string) (string, error) {
 		return "", fmt.Errorf("failed to fetch VTT: status %d", resp.StatusCode)
 	}
 
-	body, err := io.ReadAll(resp.Body)
+	body, err := config.ReadLimitedBody(resp)
 	if err != nil {
 		return "", fmt.Errorf("failed to read VTT: %w", err)
 	}
@@ -145,21 +149,19 @@ func FetchVTT(url string) (string, error) {
 }
 
 // ExtractThumbnailFromSprite extracts a thumbnail region from a sprite image
-func ExtractThumbnailFromSprite(spriteImg image.Image, cue VTTCue) ([]byte, error) {
+func ExtractThumbnailFromSprite(spriteImg image.Image, cue VTTCue) image.Image {
 	// Extract the thumbnail region using imaging library
-	thumbnail := imaging.Crop(spriteImg, image.Rect(cue.X, cue.Y, cue.X+cue.Width, cue.Y+cue.Height))
-
-	// Encode as JPEG
-	var buf bytes.Buffer
-	if err := jpeg.Encode(&buf, thumbnail, &jpeg.Options{Quality: 95}); err != nil {
-		return nil, fmt.Errorf("failed to encode thumbnail: %w", err)
-	}
+	return imaging.Crop(spriteImg, image.Rect(cue.X, cue.Y, cue.X+cue.Width, cue.Y+cue.Height))
+}
 
-	return buf.Bytes(), nil
+// SpriteSheet is a decoded scene sprite image together with its parsed VTT cues
+type SpriteSheet struct {
+	Cues  []VTTCue
+	Image image.Image
 }
 
-// ExtractFromSprite fetches sprite VTT and image, finds the thumbnail for timestamp, and returns it as bytes
-func ExtractFromSprite(spriteURL, vttURL string, timestamp float64) ([]byte, error) {
+// FetchSpriteSheet fetches and parses a scene's sprite VTT and image
+func FetchSpriteSheet(spriteURL, vttURL string) (*SpriteSheet, error) {
 	// Fetch and parse VTT
 	vttContent, err := FetchVTT(vttURL)
 	if err != nil {
@@ -171,23 +173,21 @@ func ExtractFromSprite(spriteURL, vttURL string, timestamp float64) ([]byte, err
 		return nil, fmt.Errorf("failed to parse VTT: %w", err)
 	}
 
-	// Find cue for timestamp
-	cue, err := FindCueForTimestamp(cues, timestamp)
-	if err != nil {
-		return nil, fmt.Errorf("failed to find cue: %w", err)
-	}
-
 	// Fetch sprite image
 	spriteImg, err := FetchSpriteImage(spriteURL)
 	if err != nil {
 		return nil, fmt.Errorf("failed to fetch sprite image: %w", err)
 	}
 
-	// Extract thumbnail
-	thumbnailBytes, err := ExtractThumbnailFromSprite(spriteImg, *cue)
+	return &SpriteSheet{Cues: cues, Image: spriteImg}, nil
+}
+
+// Thumbnail returns the sprite thumbnail covering the given timestamp
+func (sh *SpriteSheet) Thumbnail(timestamp float64) (image.Image, error) {
+	cue, err := FindCueForTimestamp(sh.Cues, timestamp)
 	if err != nil {
-		return nil, fmt.Errorf("failed to extract thumbnail: %w", err)
+		return nil, fmt.Errorf("failed to find cue: %w", err)
 	}
 
-	return thumbnailBytes, nil
+	return ExtractThumbnailFromSprite(sh.Image, *cue), nil
 }
@@ -1,12 +1,16 @@
 package rpc
 
 import (
+	"image"
+	"sync"
+
 	graphql "github.com/hasura/go-graphql-client"
 	"github.com/stashapp/stash/pkg/plugin/common"
 
 	"github.com/smegmarip/stash-compreface-plugin/internal/compreface"
 	"github.com/smegmarip/stash-compreface-plugin/internal/config"
 	"github.com/smegmarip/stash-compreface-plugin/internal/stash"
+	"github.com/smegmarip/stash-compreface-plugin/internal/vision"
 )
 
 // Service is the main RPC service struct
@@ -17,6 +21,14 @@ type Service struct {
 	config           *config.PluginConfig
 	tagCache         *stash.TagCache
 	comprefaceClient *compreface.Client
+
+	// Vision Service client, created and health-checked once per run
+	visionOnce      *sync.Once
+	visionClient    *vision.VisionServiceClient
+	visionClientErr error
+
+	// Serializes Compreface subject and performer creation across workers
+	createMu sync.Mutex
 }
 
 type PerformerData struct {
@@ -39,6 +51,15 @@ type IdentifyImageResponse struct {
 	Result *[]FaceIdentity `json:"result"`
 }
 
+// FaceMatchStatus is the outcome of matching a face crop against Compreface subjects
+type FaceMatchStatus string
+
+const (
+	FaceMatched    FaceMatchStatus = "matched"    // An existing subject matched the face
+	FaceUnmatched  FaceMatchStatus = "unmatched"  // No subject matched; a new subject may be created
+	FaceMisaligned FaceMatchStatus = "misaligned" // Only other faces were detected in the crop; do not create
+)
+
 // FaceQualityResult contains quality assessment outcome for CompreFace compatibility
 type FaceQualityResult struct {
 	Acceptable bool
@@ -51,9 +72,11 @@ type FaceQualityResult struct {
 }
 
 // FaceProcessingContext provides context for face processing.
-// Either Scene or ImageBytes must be provided.
+// Either Scene or Image must be provided.
 type FaceProcessingContext struct {
-	Scene      *stash.Scene // For scene processing (video/sprite extraction)
-	ImageBytes []byte       // For image processing (pre-loaded image data)
-	SourceID   string       // ID of the source (image ID or scene ID)
+	Scene    *stash.Scene // For scene processing (video/sprite extraction)
+	Image    image.Image  // For image processing (decoded once, shared by all faces)
+	Sprite   *SpriteSheet // Optional pre-fetched sprite sheet shared by all faces of a scene
+	Frames   *FrameCache  // Optional decoded-frame cache shared by all faces of a scene
+	SourceID string       // ID of the source (image ID or scene ID)
 }
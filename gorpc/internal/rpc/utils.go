@@ -2,13 +2,16 @@
 package rpc
 
 import (
+	"fmt"
 	"net/url"
 	"os"
 	"regexp"
 	"strings"
+	"sync"
 
 	"bytes"
 	"image"
+	"image/color"
 	_ "image/gif" // Register GIF format
 	"image/jpeg"
 	_ "image/png" // Register PNG format
@@ -16,6 +19,7 @@ import (
 	_ "golang.org/x/image/bmp"  // Register BMP format
 	_ "golang.org/x/image/webp" // Register WEBP format
 
+	"github.com/disintegration/imaging"
 	"github.com/rwcarlsen/goexif/exif"
 	"github.com/stashapp/stash/pkg/plugin/common/log"
 )
@@ -43,179 +47,277 @@ func (s *Service) NormalizeHost(urlStr string) string {
 // EXIF Orientation Normalization
 // ============================================================================
 
-// NormalizeImageOrientation applies EXIF orientation transformation
-// to image pixels and returns correctly-oriented JPEG bytes without EXIF.
-//
-// CRITICAL: This function prioritizes EXIF orientation tag 274 over any
-// conflicting XMP or TIFF orientation metadata to handle stale metadata.
-//
-// If no EXIF orientation is found or orientation == 1, returns original bytes unchanged.
-// If transformation fails, returns original bytes with warning log.
-func NormalizeImageOrientation(imageBytes []byte) ([]byte, error) {
+// readExifOrientation returns the EXIF orientation tag 274 from image bytes.
+// Returns 1 (normal) if no EXIF data or orientation tag is present.
+func readExifOrientation(imageBytes []byte) int {
 	// Parse EXIF from bytes (reads from EXIF IFD only, not XMP/TIFF)
-	reader := bytes.NewReader(imageBytes)
-	exifData, err := exif.Decode(reader)
+	exifData, err := exif.Decode(bytes.NewReader(imageBytes))
 	if err != nil {
-		// No EXIF data or corrupt EXIF - return original bytes
+		// No EXIF data or corrupt EXIF
 		log.Debugf("No EXIF data found or failed to decode: %v", err)
-		return imageBytes, nil
+		return 1
 	}
 
 	// Check orientation tag 274 in EXIF IFD0
 	orientationTag, err := exifData.Get(exif.Orientation)
 	if err != nil {
-		// No orientation tag - return original bytes
 		log.Debugf("No EXIF orientation tag found")
-		return imageBytes, nil
+		return 1
 	}
 
 	orientation, err := orientationTag.Int(0)
 	if err != nil {
 		log.Warnf("Failed to parse EXIF orientation value: %v", err)
-		return imageBytes, nil
+		return 1
 	}
 
-	// If orientation == 1 (normal), no transformation needed
-	if orientation == 1 {
-		log.Debugf("EXIF orientation is 1 (normal), no transformation needed")
-		return imageBytes, nil
+	return orientation
+}
+
+// OrientedImage is a decoded image with a pending EXIF orientation.
+//
+// Pixels stay in stored order; Bounds and At report oriented coordinates,
+// and SubImage applies the orientation to the requested region only.
+// Cropping a face therefore rotates just the face ROI rather than the
+// whole image.
+type OrientedImage struct {
+	Source      image.Image
+	Orientation int
+}
+
+// ColorModel returns the color model of the source image
+func (o *OrientedImage) ColorModel() color.Model {
+	return o.Source.ColorModel()
+}
+
+// Bounds returns the oriented image bounds (origin at 0,0)
+func (o *OrientedImage) Bounds() image.Rectangle {
+	b := o.Source.Bounds()
+	if o.Orientation >= 5 && o.Orientation <= 8 {
+		// Orientations 5-8 transpose width and height
+		return image.Rect(0, 0, b.Dy(), b.Dx())
 	}
+	return image.Rect(0, 0, b.Dx(), b.Dy())
+}
 
-	log.Infof("Applying EXIF orientation transformation: %d", orientation)
+// At returns the color of the pixel at oriented coordinates (x, y)
+func (o *OrientedImage) At(x, y int) color.Color {
+	if !(image.Point{x, y}.In(o.Bounds())) {
+		return o.Source.ColorModel().Convert(color.Transparent)
+	}
+	return o.Source.At(o.sourcePoint(x, y))
+}
 
-	// Decode image
-	img, format, err := image.Decode(bytes.NewReader(imageBytes))
-	if err != nil {
-		log.Warnf("Failed to decode image for EXIF normalization: %v", err)
-		return imageBytes, nil
+// SubImage returns the oriented pixels of r (in oriented coordinates).
+// Only the matching source region is cropped and transformed.
+func (o *OrientedImage) SubImage(r image.Rectangle) image.Image {
+	r = r.Intersect(o.Bounds())
+	if r.Empty() {
+		return image.NewRGBA(image.Rectangle{})
+	}
+
+	src := o.sourceRect(r)
+
+	var region image.Image
+	if sub, ok := o.Source.(interface {
+		SubImage(r image.Rectangle) image.Image
+	}); ok {
+		region = sub.SubImage(src)
+	} else {
+		region = imaging.Crop(o.Source, src)
 	}
 
-	log.Debugf("Decoded image format for EXIF normalization: %s", format)
+	return applyOrientation(region, o.Orientation)
+}
 
-	// Apply transformation based on EXIF orientation value
-	transformedImg := applyOrientation(img, orientation)
+// sourceRect maps a rectangle in oriented coordinates to the source rectangle
+// holding the same pixels. Each orientation is a flip and/or axis swap, so the
+// half-open interval bounds map directly without transforming corner points.
+func (o *OrientedImage) sourceRect(r image.Rectangle) image.Rectangle {
+	b := o.Source.Bounds()
+	w, h := b.Dx(), b.Dy()
+	x0, y0, x1, y1 := r.Min.X, r.Min.Y, r.Max.X, r.Max.Y
 
-	// Re-encode as JPEG (quality 95) without any EXIF/XMP metadata
-	var buf bytes.Buffer
-	if err := jpeg.Encode(&buf, transformedImg, &jpeg.Options{Quality: 95}); err != nil {
-		log.Warnf("Failed to re-encode image after EXIF normalization: %v", err)
-		return imageBytes, nil
+	var src image.Rectangle
+	switch o.Orientation {
+	case 2:
+		src = image.Rect(w-x1, y0, w-x0, y1)
+	case 3:
+		src = image.Rect(w-x1, h-y1, w-x0, h-y0)
+	case 4:
+		src = image.Rect(x0, h-y1, x1, h-y0)
+	case 5:
+		src = image.Rect(y0, x0, y1, x1)
+	case 6:
+		src = image.Rect(y0, h-x1, y1, h-x0)
+	case 7:
+		src = image.Rect(w-y1, h-x1, w-y0, h-x0)
+	case 8:
+		src = image.Rect(w-y1, x0, w-y0, x1)
+	default:
+		src = r
 	}
+	return src.Add(b.Min)
+}
 
-	log.Infof("Successfully normalized EXIF orientation %d -> 1", orientation)
-	return buf.Bytes(), nil
+// sourcePoint maps an oriented pixel coordinate to the source pixel coordinate
+func (o *OrientedImage) sourcePoint(x, y int) (int, int) {
+	b := o.Source.Bounds()
+	w, h := b.Dx(), b.Dy()
+
+	var sx, sy int
+	switch o.Orientation {
+	case 2:
+		sx, sy = w-1-x, y
+	case 3:
+		sx, sy = w-1-x, h-1-y
+	case 4:
+		sx, sy = x, h-1-y
+	case 5:
+		sx, sy = y, x
+	case 6:
+		sx, sy = y, h-1-x
+	case 7:
+		sx, sy = w-1-y, h-1-x
+	case 8:
+		sx, sy = w-1-y, x
+	default:
+		sx, sy = x, y
+	}
+	return sx + b.Min.X, sy + b.Min.Y
 }
 
 // applyOrientation applies EXIF orientation transformation to image
 func applyOrientation(img image.Image, orientation int) image.Image {
+	// imaging transforms operate on whole pixel rows rather than per-pixel
+	// At/Set calls; note imaging.Rotate90 is counter-clockwise.
 	switch orientation {
 	case 1:
 		return img // No transformation
 	case 2:
-		return flipHorizontal(img)
+		return imaging.FlipH(img)
 	case 3:
-		return rotate180(img)
+		return imaging.Rotate180(img)
 	case 4:
-		return flipVertical(img)
+		return imaging.FlipV(img)
 	case 5:
-		return rotate270CW(flipHorizontal(img))
+		return imaging.Transpose(img) // Flip horizontal + rotate 270 CW
 	case 6:
-		return rotate90CW(img)
+		return imaging.Rotate270(img) // Rotate 90 CW
 	case 7:
-		return rotate90CW(flipHorizontal(img))
+		return imaging.Transverse(img) // Flip horizontal + rotate 90 CW
 	case 8:
-		return rotate270CW(img)
+		return imaging.Rotate90(img) // Rotate 270 CW
 	default:
 		log.Warnf("Unknown EXIF orientation value: %d, returning original", orientation)
 		return img
 	}
 }
 
-// rotate90CW rotates image 90 degrees clockwise
-func rotate90CW(img image.Image) image.Image {
-	bounds := img.Bounds()
-	width, height := bounds.Dx(), bounds.Dy()
-
-	// New image will be rotated: width and height are swapped
-	rotated := image.NewRGBA(image.Rect(0, 0, height, width))
+// ============================================================================
+// Concurrency
+// ============================================================================
 
-	for y := 0; y < height; y++ {
-		for x := 0; x < width; x++ {
-			// (x, y) -> (height-1-y, x)
-			rotated.Set(height-1-y, x, img.At(x+bounds.Min.X, y+bounds.Min.Y))
+// forEachConcurrent calls fn for every index in [0, n) using up to workers
+// goroutines and waits for all calls to finish. With workers <= 1 the items are
+// processed sequentially in order. No new items are started once the service
+// is stopping.
+func (s *Service) forEachConcurrent(n int, workers int, fn func(i int)) {
+	if workers <= 1 {
+		for i := 0; i < n && !s.stopping; i++ {
+			fn(i)
 		}
+		return
+	}
+
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < workers && w < n; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				fn(i)
+			}
+		}()
 	}
 
-	return rotated
+	for i := 0; i < n && !s.stopping; i++ {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
 }
 
-// rotate180 rotates image 180 degrees
-func rotate180(img image.Image) image.Image {
-	bounds := img.Bounds()
-	width, height := bounds.Dx(), bounds.Dy()
+// ============================================================================
+// Image Decoding and Encoding
+// ============================================================================
 
-	rotated := image.NewRGBA(image.Rect(0, 0, width, height))
+// maxImagePixels caps the pixel count of images the plugin will decode.
+// Dimensions are read from the image header first, so oversized images are
+// rejected before any pixel memory is allocated.
+const maxImagePixels = 100_000_000
 
-	for y := 0; y < height; y++ {
-		for x := 0; x < width; x++ {
-			// (x, y) -> (width-1-x, height-1-y)
-			rotated.Set(width-1-x, height-1-y, img.At(x+bounds.Min.X, y+bounds.Min.Y))
-		}
+// checkImageSize returns an error when width x height exceeds maxImagePixels.
+func checkImageSize(width, height int) error {
+	if int64(width)*int64(height) > maxImagePixels {
+		return fmt.Errorf("image too large: %dx%d exceeds %d pixels", width, height, maxImagePixels)
 	}
-
-	return rotated
+	return nil
 }
 
-// rotate270CW rotates image 270 degrees clockwise (90 degrees counter-clockwise)
-func rotate270CW(img image.Image) image.Image {
-	bounds := img.Bounds()
-	width, height := bounds.Dx(), bounds.Dy()
-
-	// New image will be rotated: width and height are swapped
-	rotated := image.NewRGBA(image.Rect(0, 0, height, width))
-
-	for y := 0; y < height; y++ {
-		for x := 0; x < width; x++ {
-			// (x, y) -> (y, width-1-x)
-			rotated.Set(y, width-1-x, img.At(x+bounds.Min.X, y+bounds.Min.Y))
-		}
+// decodeImage decodes image bytes after validating the header dimensions
+// against maxImagePixels.
+func decodeImage(data []byte) (image.Image, string, error) {
+	cfg, _, err := image.DecodeConfig(bytes.NewReader(data))
+	if err != nil {
+		return nil, "", err
+	}
+	if err := checkImageSize(cfg.Width, cfg.Height); err != nil {
+		return nil, "", err
 	}
 
-	return rotated
+	return image.Decode(bytes.NewReader(data))
 }
 
-// flipHorizontal flips image horizontally (mirror)
-func flipHorizontal(img image.Image) image.Image {
-	bounds := img.Bounds()
-	width, height := bounds.Dx(), bounds.Dy()
+// maxPooledBufferSize bounds the capacity of buffers returned to jpegBufferPool,
+// so a single very large encode does not pin its memory for the process lifetime.
+const maxPooledBufferSize = 16 << 20
 
-	flipped := image.NewRGBA(image.Rect(0, 0, width, height))
+// jpegBufferPool holds reusable scratch buffers for JPEG encoding.
+var jpegBufferPool = sync.Pool{
+	New: func() interface{} { return new(bytes.Buffer) },
+}
 
-	for y := 0; y < height; y++ {
-		for x := 0; x < width; x++ {
-			// (x, y) -> (width-1-x, y)
-			flipped.Set(width-1-x, y, img.At(x+bounds.Min.X, y+bounds.Min.Y))
+// encodeJPEG encodes img as JPEG using a pooled scratch buffer and returns a
+// right-sized copy of the encoded bytes.
+func encodeJPEG(img image.Image, quality int) ([]byte, error) {
+	buf := jpegBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledBufferSize {
+			jpegBufferPool.Put(buf)
 		}
+	}()
+
+	if err := jpeg.Encode(buf, jpegEncodable(img), &jpeg.Options{Quality: quality}); err != nil {
+		return nil, err
 	}
 
-	return flipped
+	out := make([]byte, buf.Len())
+	copy(out, buf.Bytes())
+	return out, nil
 }
 
-// flipVertical flips image vertically
-func flipVertical(img image.Image) image.Image {
-	bounds := img.Bounds()
-	width, height := bounds.Dx(), bounds.Dy()
-
-	flipped := image.NewRGBA(image.Rect(0, 0, width, height))
-
-	for y := 0; y < height; y++ {
-		for x := 0; x < width; x++ {
-			// (x, y) -> (x, height-1-y)
-			flipped.Set(x, height-1-y, img.At(x+bounds.Min.X, y+bounds.Min.Y))
-		}
+// jpegEncodable returns img in a form the JPEG encoder has a fast path for.
+// imaging returns *image.NRGBA, which the encoder would otherwise read pixel by
+// pixel through At(); a fully opaque NRGBA has the same memory layout as RGBA,
+// so it is reinterpreted without copying.
+func jpegEncodable(img image.Image) image.Image {
+	if n, ok := img.(*image.NRGBA); ok && n.Opaque() {
+		return &image.RGBA{Pix: n.Pix, Stride: n.Stride, Rect: n.Rect}
 	}
-
-	return flipped
+	return img
 }
 
 // saveImageBytesToFile saves image bytes to specified file path for debugging
@@ -1,11 +1,9 @@
 package rpc
 
 import (
-	"bytes"
 	"encoding/json"
 	"fmt"
 	"image"
-	"image/jpeg"
 	"os"
 
 	graphql "github.com/hasura/go-graphql-client"
@@ -14,6 +12,7 @@ import (
 	"github.com/smegmarip/stash-compreface-plugin/internal/compreface"
 	"github.com/smegmarip/stash-compreface-plugin/internal/stash"
 	"github.com/smegmarip/stash-compreface-plugin/internal/vision"
+	"github.com/smegmarip/stash-compreface-plugin/pkg/utils"
 )
 
 // ============================================================================
@@ -110,38 +109,32 @@ func (s *Service) SubmitImageJob(visionClient *vision.VisionServiceClient, image
 // Image Loading Utilities
 // ============================================================================
 
-// LoadImageBytes loads an image file and returns it as JPEG bytes.
-// Supports various formats: JPEG, PNG, GIF, BMP, WEBP.
-// Note: Image format registration is done via blank imports in images.go
-func LoadImageBytes(imagePath string) ([]byte, error) {
+// LoadImage loads an image file and returns the decoded, orientation-corrected image.
+// The file is read and decoded exactly once. When EXIF orientation is set, the
+// result is an *OrientedImage: pixels are not rotated up front, and each face crop
+// (via SubImage) orients only its own region.
+// Callers cropping several faces from one image should reuse the returned image.
+func LoadImage(imagePath string) (image.Image, error) {
 	// Read original image bytes
 	imageBytes, err := os.ReadFile(imagePath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read image: %w", err)
 	}
 
-	// Normalize EXIF orientation (returns original if no transformation needed)
-	normalizedBytes, err := NormalizeImageOrientation(imageBytes)
-	if err != nil {
-		log.Warnf("Failed to normalize EXIF orientation for %s: %v (continuing with original)", imagePath, err)
-		normalizedBytes = imageBytes
-	}
-
-	// Decode normalized image
-	img, format, err := image.Decode(bytes.NewReader(normalizedBytes))
+	img, format, err := decodeImage(imageBytes)
 	if err != nil {
 		return nil, fmt.Errorf("failed to decode image: %w", err)
 	}
 
 	log.Debugf("Decoded image format: %s", format)
 
-	// Re-encode as JPEG
-	var buf bytes.Buffer
-	if err := jpeg.Encode(&buf, img, &jpeg.Options{Quality: 95}); err != nil {
-		return nil, fmt.Errorf("failed to encode image as JPEG: %w", err)
+	// Defer EXIF orientation to crop time (applied per face region)
+	if orientation := readExifOrientation(imageBytes); orientation != 1 {
+		log.Infof("Deferring EXIF orientation transformation to face crops: %d", orientation)
+		img = &OrientedImage{Source: img, Orientation: orientation}
 	}
 
-	return buf.Bytes(), nil
+	return img, nil
 }
 
 // ============================================================================
@@ -180,43 +173,55 @@ func (s *Service) processFace(visionClient *vision.VisionServiceClient, ctx Face
 	}
 
 	// Extract frame/thumbnail based on context
-	frameBytes, err := s.extractFrameBytesFromContext(visionClient, ctx, face, metadata)
+	frame, err := s.extractFrameFromContext(visionClient, ctx, face, metadata)
 	if err != nil {
 		return "", err
 	}
 
 	// Crop face from frame using bounding box
-	faceCrop, err := s.cropFaceFromFrame(frameBytes, det.BBox, 20)
+	faceCrop, faceBox, err := s.cropFaceFromFrame(frame, det.BBox, 20)
 	if err != nil {
-		if faceCrop != nil {
-			log.Warnf("Using uncropped frame for face %s due to cropping error: %v", face.FaceID, err)
-		} else {
-			return "", fmt.Errorf("failed to crop face: %w", err)
-		}
+		return "", fmt.Errorf("failed to crop face: %w", err)
 	}
 
 	log.Debugf("Extracted and cropped face from frame (%.0f bytes)", len(faceCrop))
 
 	// Try to recognize face in Compreface
-	recognitionResp, err := s.comprefaceClient.RecognizeFacesFromBytes(faceCrop, "face.jpg")
+	match, status, err := s.matchFaceSubject(faceCrop, faceBox)
 	if err != nil {
-		return "", fmt.Errorf("compreface recognition failed: %w", err)
+		return "", err
+	}
+	switch status {
+	case FaceMatched:
+		// find and return existing performer by matched subject, or empty if not found
+		return s.findExistingStashPerformerBySubject(*match, face)
+	case FaceMisaligned:
+		// The crop would enroll a neighbouring face as a new subject
+		log.Infof("Skipping face %s: Compreface only detected neighbouring faces in the crop", face.FaceID)
+		return "", nil
 	}
 
-	// Check if face matched to existing subject
-	if len(recognitionResp.Result) > 0 && len(recognitionResp.Result[0].Subjects) > 0 {
-		// Face matched to existing subject
-		bestMatch := recognitionResp.Result[0].Subjects[0] // Highest similarity match
-		if bestMatch.Similarity < s.config.MinSimilarity {
-			// Similarity too low, treat as no match
-			goto createNewSubject
-		}
+	// Check quality for subject creation before any further Compreface calls
+	if err := s.checkCreationQuality(face); err != nil {
+		return "", err
+	}
 
-		// find and return existing performer by matched subject, or empty if not found
-		return s.findExistingStashPerformerBySubject(bestMatch, face)
+	// With concurrent workers, serialize subject creation so two workers cannot
+	// create separate subjects for the same person; recognize again once the
+	// lock is held in case another worker created a matching subject meanwhile.
+	if s.concurrentProcessing() {
+		s.createMu.Lock()
+		defer s.createMu.Unlock()
+
+		match, status, err = s.matchFaceSubject(faceCrop, faceBox)
+		if err != nil {
+			return "", err
+		}
+		if status == FaceMatched {
+			return s.findExistingStashPerformerBySubject(*match, face)
+		}
 	}
 
-createNewSubject:
 	// first, create Compreface subject
 	addResponse, err := s.createComprefaceSubject(faceCrop, ctx, face)
 	if err != nil {
@@ -230,6 +235,18 @@ createNewSubject:
 	return performerID, nil
 }
 
+// matchFaceSubject recognizes a cropped face in Compreface and classifies the
+// results against the expected face box (see ClassifyRecognition).
+func (s *Service) matchFaceSubject(faceCrop []byte, faceBox compreface.BoundingBox) (*compreface.FaceRecognition, FaceMatchStatus, error) {
+	recognitionResp, err := s.comprefaceClient.RecognizeFacesFromBytes(faceCrop, "face.jpg")
+	if err != nil {
+		return nil, FaceUnmatched, fmt.Errorf("compreface recognition failed: %w", err)
+	}
+
+	match, status := ClassifyRecognition(recognitionResp.Result, faceBox, s.config.MinSimilarity)
+	return match, status, nil
+}
+
 // processFaceForIdentification processes a Vision-detected face for the identify workflow.
 // Returns FaceIdentity with metadata instead of just performerID.
 // Respects createPerformer flag - if false, only attempts recognition without creation.
@@ -279,29 +296,28 @@ func (s *Service) processFaceForIdentification(
 	// Step 2-6: If no embedding match, try image-based or create
 	if performerID == "" {
 		// Step 2: Extract frame and crop face
-		frameBytes, err := s.extractFrameBytesFromContext(visionClient, ctx, face, metadata)
+		frame, err := s.extractFrameFromContext(visionClient, ctx, face, metadata)
 		if err != nil {
 			return nil, fmt.Errorf("failed to extract frame: %w", err)
 		}
 
-		faceCrop, err := s.cropFaceFromFrame(frameBytes, det.BBox, 20)
-		if err != nil && faceCrop == nil {
+		faceCrop, faceBox, err := s.cropFaceFromFrame(frame, det.BBox, 20)
+		if err != nil {
 			return nil, fmt.Errorf("failed to crop face: %w", err)
 		}
 
-		// Step 3: Try image-based recognition
-		recognitionResp, err := s.comprefaceClient.RecognizeFacesFromBytes(faceCrop, "face.jpg")
+		// Step 3-4: Try image-based recognition against existing subjects
+		match, status, err := s.matchFaceSubject(faceCrop, faceBox)
 		if err != nil {
-			return nil, fmt.Errorf("compreface recognition failed: %w", err)
+			return nil, err
 		}
-
-		// Step 4: Check if matched to existing subject
-		if len(recognitionResp.Result) > 0 && len(recognitionResp.Result[0].Subjects) > 0 {
-			bestMatch := recognitionResp.Result[0].Subjects[0]
-			if bestMatch.Similarity >= s.config.MinSimilarity {
-				performerID, _ = s.findExistingStashPerformerBySubject(bestMatch, face)
-				similarity = bestMatch.Similarity
-			}
+		if status == FaceMisaligned {
+			log.Infof("Skipping face %s for identification: Compreface only detected neighbouring faces in the crop", face.FaceID)
+			return nil, nil
+		}
+		if status == FaceMatched {
+			performerID, _ = s.findExistingStashPerformerBySubject(*match, face)
+			similarity = match.Similarity
 		}
 
 		// Step 5: No match found
@@ -315,10 +331,34 @@ func (s *Service) processFaceForIdentification(
 				return identity, nil
 			}
 
-			// Step 6: Create new subject and performer
+			// Step 6: Check creation quality, then serialize creation as in
+			// processFace, re-checking for a subject another worker created
+			if err := s.checkCreationQuality(face); err != nil {
+				identity.Performer.Name = createSubjectName(ctx.SourceID, face.FaceID)
+				conf := 0.0
+				identity.Confidence = &conf
+				return identity, nil
+			}
+
+			if s.concurrentProcessing() {
+				s.createMu.Lock()
+				defer s.createMu.Unlock()
+
+				match, status, err = s.matchFaceSubject(faceCrop, faceBox)
+				if err != nil {
+					return nil, err
+				}
+				if status == FaceMatched {
+					performerID, _ = s.findExistingStashPerformerBySubject(*match, face)
+					similarity = match.Similarity
+				}
+			}
+		}
+
+		// Still unmatched: create new subject and performer
+		if performerID == "" {
 			addResponse, err := s.createComprefaceSubject(faceCrop, ctx, face)
 			if err != nil {
-				// Quality too low or creation failed
 				identity.Performer.Name = createSubjectName(ctx.SourceID, face.FaceID)
 				conf := 0.0
 				identity.Confidence = &conf
@@ -369,8 +409,10 @@ func (s *Service) recognizeEmbeddedStashFace(face vision.VisionFace) (graphql.ID
 	return "", nil
 }
 
-// extractFrameBytesFromContext extracts the appropriate frame bytes based on the processing context.
-func (s *Service) extractFrameBytesFromContext(visionClient *vision.VisionServiceClient, ctx FaceProcessingContext, face vision.VisionFace, metadata vision.ResultMetadata) ([]byte, error) {
+// extractFrameFromContext returns the decoded frame for a face based on the processing context.
+// Image sources reuse the pre-decoded ctx.Image; scene frames are served from the
+// scene's frame cache, so faces sharing a frame extract and decode it only once.
+func (s *Service) extractFrameFromContext(visionClient *vision.VisionServiceClient, ctx FaceProcessingContext, face vision.VisionFace, metadata vision.ResultMetadata) (image.Image, error) {
 	// Get the representative detection (best quality frame)
 	det := face.RepresentativeDetection
 
@@ -382,34 +424,45 @@ func (s *Service) extractFrameBytesFromContext(visionClient *vision.VisionServic
 	}
 
 	// Extract frame/thumbnail based on context
-	var frameBytes []byte
-	var err error
-
-	if ctx.ImageBytes != nil {
-		// Use pre-loaded image bytes (for image processing)
-		frameBytes = ctx.ImageBytes
-	} else if metadata.Method == "sprites" && ctx.Scene != nil {
-		// Extract thumbnail from sprite image
-		spriteVTT := s.NormalizeHost(ctx.Scene.Paths.VTT)
-		spriteImage := s.NormalizeHost(ctx.Scene.Paths.Sprite)
-
-		log.Debugf("Extracting face from sprite: vtt=%s, sprite=%s, timestamp=%.2f",
-			spriteVTT, spriteImage, det.Timestamp)
-		frameBytes, err = ExtractFromSprite(spriteImage, spriteVTT, det.Timestamp)
+	if ctx.Image != nil {
+		// Use pre-decoded image (for image processing)
+		return ctx.Image, nil
+	} else if metadata.Method == "sprites" && ctx.Sprite != nil {
+		// Extract thumbnail from the scene's pre-fetched sprite sheet
+		thumbnail, err := ctx.Sprite.Thumbnail(det.Timestamp)
 		if err != nil {
 			return nil, fmt.Errorf("failed to extract sprite thumbnail at %.2fs: %w", det.Timestamp, err)
 		}
-	} else if ctx.Scene != nil {
-		// Extract frame from video at the representative detection timestamp
-		videoPath := ctx.Scene.Files[0].Path
-		frameBytes, err = visionClient.ExtractFrame(videoPath, det.Timestamp, frameEnhancement)
+		return thumbnail, nil
+	} else if metadata.Method == "sprites" && ctx.Scene != nil {
+		// The scene's sprite prefetch failed; re-fetching per face would repeat
+		// the full download (and failure) once for every face
+		return nil, fmt.Errorf("sprite sheet unavailable for scene %s", ctx.Scene.ID)
+	} else if ctx.Scene == nil {
+		return nil, fmt.Errorf("no scene or image provided for frame extraction")
+	}
+
+	// Extract frame from video at the representative detection timestamp,
+	// reusing it when another face of the scene was cropped from the same frame
+	videoPath := ctx.Scene.Files[0].Path
+	extract := func() (image.Image, error) {
+		frameBytes, err := visionClient.ExtractFrame(videoPath, det.Timestamp, frameEnhancement)
 		if err != nil {
 			return nil, fmt.Errorf("failed to extract frame at %.2fs: %w", det.Timestamp, err)
 		}
-	} else {
-		return nil, fmt.Errorf("no scene or image bytes provided for frame extraction")
+
+		frame, _, err := decodeImage(frameBytes)
+		if err != nil {
+			return nil, fmt.Errorf("failed to decode frame: %w", err)
+		}
+		return frame, nil
 	}
-	return frameBytes, nil
+
+	if ctx.Frames == nil {
+		return extract()
+	}
+	key := FrameKey{VideoPath: videoPath, Timestamp: det.Timestamp, Enhanced: frameEnhancement != nil}
+	return ctx.Frames.GetOrLoad(key, extract)
 }
 
 // findExistingStashPerformerBySubject finds a Stash performer by Compreface subject name from recognition result.
@@ -441,23 +494,31 @@ func (s *Service) findExistingStashPerformerBySubject(recognitionResult comprefa
 	return "", nil
 }
 
-// createComprefaceSubject creates a new subject in Compreface for an unmatched face.
-func (s *Service) createComprefaceSubject(faceImage []byte, ctx FaceProcessingContext, face vision.VisionFace) (*compreface.AddSubjectResponse, error) {
-	// Get the representative detection (best quality frame)
-	det := face.RepresentativeDetection
-
-	// Check quality for subject creation (higher bar than recognition)
-	qrCreate := s.assessFaceQuality(det.Quality, s.config.MinQualityScore)
+// checkCreationQuality returns an error when a face falls below the quality
+// bar for subject creation (higher than the bar for recognition).
+func (s *Service) checkCreationQuality(face vision.VisionFace) error {
+	qrCreate := s.assessFaceQuality(face.RepresentativeDetection.Quality, s.config.MinQualityScore)
 	if !qrCreate.Acceptable {
 		err := fmt.Errorf("skipping face %s for subject creation: %s", face.FaceID, qrCreate.Reason)
 		log.Debugf(err.Error())
-		return nil, err
+		return err
 	}
+	return nil
+}
 
+// concurrentProcessing reports whether images or faces may be processed by
+// several workers at once, in which case subject creation must be serialized.
+func (s *Service) concurrentProcessing() bool {
+	return s.config.MaxConcurrentImages > 1 || s.config.MaxConcurrentFaces > 1
+}
+
+// createComprefaceSubject creates a new subject in Compreface for an unmatched face.
+// Callers apply checkCreationQuality first.
+func (s *Service) createComprefaceSubject(faceImage []byte, ctx FaceProcessingContext, face vision.VisionFace) (*compreface.AddSubjectResponse, error) {
 	// No match - create new subject and performer
 	subjectName := createSubjectName(ctx.SourceID, face.FaceID)
 
-	log.Debugf("Creating new subject for unmatched face %s (composite=%.2f)", face.FaceID, qrCreate.Composite)
+	log.Debugf("Creating new subject for unmatched face %s", face.FaceID)
 
 	// Add subject to Compreface with face crop
 	addResponse, err := s.comprefaceClient.AddSubjectFromBytes(subjectName, faceImage, "face.jpg")
@@ -499,14 +560,9 @@ func (s *Service) createStashPerformerFromComprefaceSubject(comprefaceImageId st
 	return graphql.ID(performer.ID), nil
 }
 
-// cropFaceFromFrame crops a face region from a frame using the bounding box
-func (s *Service) cropFaceFromFrame(frameBytes []byte, bbox vision.VisionBoundingBox, padding int) ([]byte, error) {
-	// Decode frame bytes to image.Image
-	img, _, err := image.Decode(bytes.NewReader(frameBytes))
-	if err != nil {
-		return frameBytes, fmt.Errorf("failed to decode frame: %w", err)
-	}
-
+// cropFaceFromFrame crops a face region from a decoded frame using the bounding box.
+// It also returns the face box translated into the crop's coordinate space.
+func (s *Service) cropFaceFromFrame(frame image.Image, bbox vision.VisionBoundingBox, padding int) ([]byte, compreface.BoundingBox, error) {
 	// Convert Vision bbox to Compreface bbox (same structure, just different types)
 	cfBox := compreface.BoundingBox{
 		XMin: bbox.XMin,
@@ -516,18 +572,76 @@ func (s *Service) cropFaceFromFrame(frameBytes []byte, bbox vision.VisionBoundin
 	}
 
 	// Reuse existing cropping logic with padding
-	cropped, err := s.extractBoxImage(img, cfBox, padding)
+	cropped, err := s.extractBoxImage(frame, cfBox, padding)
 	if err != nil {
-		return frameBytes, fmt.Errorf("failed to crop face region: %w", err)
+		return nil, compreface.BoundingBox{}, fmt.Errorf("failed to crop face region: %w", err)
 	}
 
 	// Encode cropped image back to JPEG bytes
-	buf := new(bytes.Buffer)
-	if err := jpeg.Encode(buf, cropped, &jpeg.Options{Quality: 90}); err != nil {
-		return frameBytes, fmt.Errorf("failed to encode cropped face: %w", err)
+	faceBytes, err := encodeJPEG(cropped, 90)
+	if err != nil {
+		return nil, compreface.BoundingBox{}, fmt.Errorf("failed to encode cropped face: %w", err)
+	}
+
+	origin := paddedBoxRect(frame.Bounds(), cfBox, padding).Min
+	localBox := compreface.BoundingBox{
+		XMin: cfBox.XMin - origin.X,
+		YMin: cfBox.YMin - origin.Y,
+		XMax: cfBox.XMax - origin.X,
+		YMax: cfBox.YMax - origin.Y,
 	}
 
-	return buf.Bytes(), nil
+	return faceBytes, localBox, nil
+}
+
+// minMatchIoU is the minimum overlap between a Compreface detection and the
+// expected face box for the detection to be treated as that face
+const minMatchIoU = 0.3
+
+// MatchRecognitionResult returns the recognition result whose detected face
+// best overlaps the expected face box, or nil when no result overlaps it by at
+// least minMatchIoU. A padded crop can include neighbouring faces, so the first
+// result is not necessarily the face that was cropped, and when Compreface
+// only found the neighbours there is no match at all.
+func MatchRecognitionResult(results []compreface.RecognitionResult, expected compreface.BoundingBox) *compreface.RecognitionResult {
+	best := -1
+	bestIoU := 0.0
+	for i := range results {
+		if iou := utils.IoU(results[i].Box, expected); iou > bestIoU {
+			best, bestIoU = i, iou
+		}
+	}
+	if bestIoU < minMatchIoU {
+		return nil
+	}
+	return &results[best]
+}
+
+// ClassifyRecognition decides how a face crop relates to existing subjects.
+// It returns FaceMatched with the best subject when the result overlapping the
+// expected face box has a subject at or above minSimilarity. It returns
+// FaceMisaligned when Compreface detected faces but none of them is the
+// expected face: the crop then shows a neighbour, and enrolling it would create
+// a duplicate subject. Otherwise it returns FaceUnmatched.
+func ClassifyRecognition(results []compreface.RecognitionResult, expected compreface.BoundingBox, minSimilarity float64) (*compreface.FaceRecognition, FaceMatchStatus) {
+	result := MatchRecognitionResult(results, expected)
+	if result == nil {
+		if len(results) > 0 {
+			return nil, FaceMisaligned
+		}
+		return nil, FaceUnmatched
+	}
+
+	if len(result.Subjects) == 0 {
+		return nil, FaceUnmatched
+	}
+
+	// Highest similarity match; too low is treated as no match
+	bestMatch := result.Subjects[0]
+	if bestMatch.Similarity < minSimilarity {
+		return nil, FaceUnmatched
+	}
+	return &bestMatch, FaceMatched
 }
 
 // createSubjectName creates a unique subject name for Compreface
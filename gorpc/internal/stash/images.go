@@ -3,11 +3,12 @@ package stash
 import (
 	"context"
 	"fmt"
-	"io"
 	"net/http"
 
 	graphql "github.com/hasura/go-graphql-client"
 	"github.com/stashapp/stash/pkg/plugin/common/log"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/config"
 )
 
 // ============================================================================
@@ -186,7 +187,7 @@ func DownloadImage(imageURL string, sessionCookie *http.Cookie) ([]byte, error)
 		return nil, fmt.Errorf("failed to download image: status %d", resp.StatusCode)
 	}
 
-	imageBytes, err := io.ReadAll(resp.Body)
+	imageBytes, err := config.ReadLimitedBody(resp)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read image: %w", err)
 	}
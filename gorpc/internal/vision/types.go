@@ -1,6 +1,7 @@
 package vision
 
 import (
+	"encoding/json"
 	"net/http"
 	"time"
 )
@@ -77,14 +78,14 @@ type JobStatus struct {
 
 // AnalyzeResults represents the full analysis results from Vision API
 type AnalyzeResults struct {
-	JobID     string        `json:"job_id"`
-	SourceID  string        `json:"source_id"`
-	Status    string        `json:"status"`
-	Faces     *FacesResults `json:"faces,omitempty"`     // Faces module results
-	Scenes    interface{}   `json:"scenes,omitempty"`    // Scenes module results (not used yet)
-	Semantics interface{}   `json:"semantics,omitempty"` // Semantics module results (Phase 2)
-	Objects   interface{}   `json:"objects,omitempty"`   // Objects module results (Phase 3)
-	Metadata  interface{}   `json:"metadata,omitempty"`  // Processing metadata
+	JobID     string          `json:"job_id"`
+	SourceID  string          `json:"source_id"`
+	Status    string          `json:"status"`
+	Faces     *FacesResults   `json:"faces,omitempty"`     // Faces module results
+	Scenes    json.RawMessage `json:"scenes,omitempty"`    // Scenes module results (not used yet, left undecoded)
+	Semantics json.RawMessage `json:"semantics,omitempty"` // Semantics module results (Phase 2, left undecoded)
+	Objects   json.RawMessage `json:"objects,omitempty"`   // Objects module results (Phase 3, left undecoded)
+	Metadata  json.RawMessage `json:"metadata,omitempty"`  // Processing metadata (left undecoded)
 }
 
 // FacesResults represents face analysis results from the Faces service
@@ -114,15 +115,15 @@ type Demographics struct {
 
 // VisionDetection represents a single face detection in a frame
 type VisionDetection struct {
-	FrameIndex int                    `json:"frame_index"`
-	Timestamp  float64                `json:"timestamp"`
-	BBox       VisionBoundingBox      `json:"bbox"`
-	Confidence float64                `json:"confidence"`
-	Quality    *QualityResult         `json:"quality,omitempty"`
-	Pose       string                 `json:"pose"`
-	Landmarks  map[string]interface{} `json:"landmarks,omitempty"`
-	Enhanced   bool                   `json:"enhanced,omitempty"` // True if face was enhanced via CodeFormer/GFPGAN
-	Occlusion  *OcclusionResult       `json:"occlusion,omitempty"`
+	FrameIndex int               `json:"frame_index"`
+	Timestamp  float64           `json:"timestamp"`
+	BBox       VisionBoundingBox `json:"bbox"`
+	Confidence float64           `json:"confidence"`
+	Quality    *QualityResult    `json:"quality,omitempty"`
+	Pose       string            `json:"pose"`
+	Landmarks  json.RawMessage   `json:"landmarks,omitempty"` // Not used by the plugin; kept raw to skip decoding per detection
+	Enhanced   bool              `json:"enhanced,omitempty"`  // True if face was enhanced via CodeFormer/GFPGAN
+	Occlusion  *OcclusionResult  `json:"occlusion,omitempty"`
 }
 
 // QualityResult represents face quality assessment
@@ -9,6 +9,8 @@ import (
 	"time"
 
 	"github.com/stashapp/stash/pkg/plugin/common/log"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/config"
 )
 
 // ============================================================================
@@ -275,13 +277,11 @@ func (c *VisionServiceClient) ExtractFrame(videoPath string, timestamp float64,
 		return nil, fmt.Errorf("frame extraction failed: status %d", resp.StatusCode)
 	}
 
-	// Read frame bytes
-	var buf bytes.Buffer
-	_, err = buf.ReadFrom(resp.Body)
+	frameBytes, err := config.ReadLimitedBody(resp)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read frame: %w", err)
 	}
 
-	log.Tracef("Frame extracted: %d bytes", buf.Len())
-	return buf.Bytes(), nil
+	log.Tracef("Frame extracted: %d bytes", len(frameBytes))
+	return frameBytes, nil
 }
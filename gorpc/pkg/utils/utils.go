@@ -1,6 +1,8 @@
 package utils
 
 import (
+	"math"
+
 	graphql "github.com/hasura/go-graphql-client"
 
 	"github.com/smegmarip/stash-compreface-plugin/internal/compreface"
@@ -27,6 +29,33 @@ func IsFaceSizeValid(box compreface.BoundingBox, minSize int) bool {
 	return width >= minSize && height >= minSize
 }
 
+// ScaleBoundingBox scales a face bounding box by independent x and y factors,
+// rounding each edge to the nearest pixel. Probability is preserved.
+func ScaleBoundingBox(box compreface.BoundingBox, scaleX, scaleY float64) compreface.BoundingBox {
+	return compreface.BoundingBox{
+		XMin:        int(math.Round(float64(box.XMin) * scaleX)),
+		YMin:        int(math.Round(float64(box.YMin) * scaleY)),
+		XMax:        int(math.Round(float64(box.XMax) * scaleX)),
+		YMax:        int(math.Round(float64(box.YMax) * scaleY)),
+		Probability: box.Probability,
+	}
+}
+
+// IoU returns the intersection-over-union of two face bounding boxes,
+// in the range 0 (disjoint) to 1 (identical).
+func IoU(a, b compreface.BoundingBox) float64 {
+	interW := Min(a.XMax, b.XMax) - Max(a.XMin, b.XMin)
+	interH := Min(a.YMax, b.YMax) - Max(a.YMin, b.YMin)
+	if interW <= 0 || interH <= 0 {
+		return 0
+	}
+
+	intersection := float64(interW * interH)
+	areaA := float64((a.XMax - a.XMin) * (a.YMax - a.YMin))
+	areaB := float64((b.XMax - b.XMin) * (b.YMax - b.YMin))
+	return intersection / (areaA + areaB - intersection)
+}
+
 // DeduplicateIDs removes duplicate IDs from a slice
 func DeduplicateIDs(ids []graphql.ID) []graphql.ID {
 	seen := make(map[graphql.ID]bool)
@@ -17,12 +17,15 @@ func TestPluginConfig_Defaults(t *testing.T) {
 	cfg := &config.PluginConfig{
 		CooldownSeconds:           10,
 		MaxBatchSize:              20,
+		MaxConcurrentImages:       1,
+		MaxConcurrentFaces:        1,
 		MinSimilarity:             0.81,
 		MinFaceSize:               64,
 		MinConfidenceScore:        0.7,
 		MinQualityScore:           0, // 0 = use component gates
 		MinProcessingQualityScore: 0, // 0 = use component gates
 		EnhanceQualityScoreTrigger: 0.5,
+		DetectorBackend:           config.DetectorAuto,
 		ScannedTagName:            "Compreface Scanned",
 		MatchedTagName:            "Compreface Matched",
 		PartialTagName:            "Compreface Partial",
@@ -32,12 +35,15 @@ func TestPluginConfig_Defaults(t *testing.T) {
 
 	assert.Equal(t, 10, cfg.CooldownSeconds)
 	assert.Equal(t, 20, cfg.MaxBatchSize)
+	assert.Equal(t, 1, cfg.MaxConcurrentImages)
+	assert.Equal(t, 1, cfg.MaxConcurrentFaces)
 	assert.Equal(t, 0.81, cfg.MinSimilarity)
 	assert.Equal(t, 64, cfg.MinFaceSize)
 	assert.Equal(t, 0.7, cfg.MinConfidenceScore)
 	assert.Equal(t, 0.0, cfg.MinQualityScore)
 	assert.Equal(t, 0.0, cfg.MinProcessingQualityScore)
 	assert.Equal(t, 0.5, cfg.EnhanceQualityScoreTrigger)
+	assert.Equal(t, "auto", cfg.DetectorBackend)
 	assert.Equal(t, "Compreface Scanned", cfg.ScannedTagName)
 	assert.Equal(t, "Compreface Matched", cfg.MatchedTagName)
 	assert.Equal(t, "Compreface Partial", cfg.PartialTagName)
@@ -0,0 +1,44 @@
+package config_test
+
+import (
+	"bytes"
+	"io"
+	"net/http"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/config"
+)
+
+// zeroReader yields an endless stream of zero bytes
+type zeroReader struct{}
+
+func (zeroReader) Read(p []byte) (int, error) {
+	for i := range p {
+		p[i] = 0
+	}
+	return len(p), nil
+}
+
+func TestReadLimitedBody(t *testing.T) {
+	t.Run("reads body within limit", func(t *testing.T) {
+		resp := &http.Response{Body: io.NopCloser(strings.NewReader("WEBVTT")), ContentLength: 6}
+		body, err := config.ReadLimitedBody(resp)
+		assert.NoError(t, err)
+		assert.Equal(t, []byte("WEBVTT"), body)
+	})
+
+	t.Run("rejects oversized Content-Length before reading", func(t *testing.T) {
+		resp := &http.Response{Body: io.NopCloser(bytes.NewReader(nil)), ContentLength: config.MaxDownloadBytes + 1}
+		_, err := config.ReadLimitedBody(resp)
+		assert.Error(t, err)
+	})
+
+	t.Run("rejects oversized body without Content-Length", func(t *testing.T) {
+		resp := &http.Response{Body: io.NopCloser(zeroReader{}), ContentLength: -1}
+		_, err := config.ReadLimitedBody(resp)
+		assert.Error(t, err)
+	})
+}
@@ -0,0 +1,121 @@
+package rpc_test
+
+import (
+	"errors"
+	"image"
+	"sync"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/rpc"
+)
+
+func TestFrameCache_GetSet(t *testing.T) {
+	cache := rpc.NewFrameCache(2)
+	key := rpc.FrameKey{VideoPath: "/videos/a.mp4", Timestamp: 1.5}
+
+	_, found := cache.Get(key)
+	assert.False(t, found, "cache should be empty initially")
+
+	frame := image.NewRGBA(image.Rect(0, 0, 4, 4))
+	cache.Set(key, frame)
+
+	cached, found := cache.Get(key)
+	assert.True(t, found, "frame should be in cache")
+	assert.Same(t, frame, cached, "cached frame should be the stored frame")
+
+	// Enhanced frames are cached separately from raw frames
+	_, found = cache.Get(rpc.FrameKey{VideoPath: "/videos/a.mp4", Timestamp: 1.5, Enhanced: true})
+	assert.False(t, found, "enhanced frame should not match raw frame")
+}
+
+func TestFrameCache_EvictsOldest(t *testing.T) {
+	cache := rpc.NewFrameCache(2)
+	keys := []rpc.FrameKey{
+		{VideoPath: "/videos/a.mp4", Timestamp: 1},
+		{VideoPath: "/videos/a.mp4", Timestamp: 2},
+		{VideoPath: "/videos/a.mp4", Timestamp: 3},
+	}
+
+	for _, key := range keys {
+		cache.Set(key, image.NewRGBA(image.Rect(0, 0, 1, 1)))
+	}
+
+	_, found := cache.Get(keys[0])
+	assert.False(t, found, "oldest frame should be evicted")
+	for _, key := range keys[1:] {
+		_, found := cache.Get(key)
+		assert.True(t, found, "frame at %.0fs should be cached", key.Timestamp)
+	}
+}
+
+func TestFrameCache_ConcurrentAccess(t *testing.T) {
+	cache := rpc.NewFrameCache(4)
+	var wg sync.WaitGroup
+
+	for i := 0; i < 10; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			key := rpc.FrameKey{VideoPath: "/videos/a.mp4", Timestamp: float64(i)}
+			cache.Set(key, image.NewRGBA(image.Rect(0, 0, 1, 1)))
+			cache.Get(key)
+		}(i)
+	}
+
+	wg.Wait()
+}
+
+func TestFrameCache_GetOrLoadSharesConcurrentMisses(t *testing.T) {
+	cache := rpc.NewFrameCache(2)
+	key := rpc.FrameKey{VideoPath: "/videos/a.mp4", Timestamp: 1}
+	frame := image.NewRGBA(image.Rect(0, 0, 1, 1))
+
+	var loads int32
+	release := make(chan struct{})
+	load := func() (image.Image, error) {
+		atomic.AddInt32(&loads, 1)
+		<-release
+		return frame, nil
+	}
+
+	var wg sync.WaitGroup
+	results := make([]image.Image, 8)
+	for i := range results {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			results[i], _ = cache.GetOrLoad(key, load)
+		}(i)
+	}
+	close(release)
+	wg.Wait()
+
+	assert.Equal(t, int32(1), atomic.LoadInt32(&loads), "concurrent misses should share one load")
+	for _, result := range results {
+		assert.Same(t, frame, result)
+	}
+
+	// Later calls are served from the cache
+	cached, err := cache.GetOrLoad(key, func() (image.Image, error) {
+		t.Fatal("cached frame should not be reloaded")
+		return nil, nil
+	})
+	assert.NoError(t, err)
+	assert.Same(t, frame, cached)
+}
+
+func TestFrameCache_GetOrLoadDoesNotCacheErrors(t *testing.T) {
+	cache := rpc.NewFrameCache(2)
+	key := rpc.FrameKey{VideoPath: "/videos/a.mp4", Timestamp: 1}
+
+	_, err := cache.GetOrLoad(key, func() (image.Image, error) {
+		return nil, errors.New("extraction failed")
+	})
+	assert.Error(t, err)
+
+	_, found := cache.Get(key)
+	assert.False(t, found, "failed load should not be cached")
+}
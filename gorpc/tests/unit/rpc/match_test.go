@@ -0,0 +1,118 @@
+package rpc_test
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/compreface"
+	"github.com/smegmarip/stash-compreface-plugin/internal/rpc"
+)
+
+func recognitionResult(subject string, box compreface.BoundingBox) compreface.RecognitionResult {
+	return compreface.RecognitionResult{
+		Box:      box,
+		Subjects: []compreface.FaceRecognition{{Subject: subject, Similarity: 0.9}},
+	}
+}
+
+func TestMatchRecognitionResult(t *testing.T) {
+	expected := compreface.BoundingBox{XMin: 100, YMin: 100, XMax: 200, YMax: 200}
+	target := recognitionResult("target", compreface.BoundingBox{XMin: 105, YMin: 102, XMax: 205, YMax: 198})
+	leftNeighbour := recognitionResult("left", compreface.BoundingBox{XMin: 0, YMin: 100, XMax: 90, YMax: 200})
+	rightNeighbour := recognitionResult("right", compreface.BoundingBox{XMin: 210, YMin: 100, XMax: 300, YMax: 200})
+	grazing := recognitionResult("grazing", compreface.BoundingBox{XMin: 180, YMin: 100, XMax: 280, YMax: 200})
+
+	tests := []struct {
+		name     string
+		results  []compreface.RecognitionResult
+		expected string
+	}{
+		{name: "no results", results: nil, expected: ""},
+		{name: "single overlapping result", results: []compreface.RecognitionResult{target}, expected: "target"},
+		{name: "single neighbour only", results: []compreface.RecognitionResult{leftNeighbour}, expected: ""},
+		{
+			name:     "target after neighbour",
+			results:  []compreface.RecognitionResult{leftNeighbour, target, rightNeighbour},
+			expected: "target",
+		},
+		{
+			name:     "only neighbours found",
+			results:  []compreface.RecognitionResult{leftNeighbour, rightNeighbour},
+			expected: "",
+		},
+		{
+			name:     "best overlap below threshold",
+			results:  []compreface.RecognitionResult{leftNeighbour, grazing},
+			expected: "",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result := rpc.MatchRecognitionResult(tt.results, expected)
+			if tt.expected == "" {
+				assert.Nil(t, result)
+				return
+			}
+			if assert.NotNil(t, result) {
+				assert.Equal(t, tt.expected, result.Subjects[0].Subject)
+			}
+		})
+	}
+}
+
+func TestClassifyRecognition(t *testing.T) {
+	expected := compreface.BoundingBox{XMin: 100, YMin: 100, XMax: 200, YMax: 200}
+	targetBox := compreface.BoundingBox{XMin: 105, YMin: 102, XMax: 205, YMax: 198}
+	neighbour := recognitionResult("neighbour", compreface.BoundingBox{XMin: 0, YMin: 100, XMax: 90, YMax: 200})
+	weakTarget := compreface.RecognitionResult{
+		Box:      targetBox,
+		Subjects: []compreface.FaceRecognition{{Subject: "weak", Similarity: 0.5}},
+	}
+
+	tests := []struct {
+		name     string
+		results  []compreface.RecognitionResult
+		status   rpc.FaceMatchStatus
+		expected string
+	}{
+		{name: "no detections allows creation", results: nil, status: rpc.FaceUnmatched},
+		{
+			name:     "target matched",
+			results:  []compreface.RecognitionResult{neighbour, recognitionResult("target", targetBox)},
+			status:   rpc.FaceMatched,
+			expected: "target",
+		},
+		{
+			name:    "target without subjects allows creation",
+			results: []compreface.RecognitionResult{{Box: targetBox}},
+			status:  rpc.FaceUnmatched,
+		},
+		{
+			name:    "target below similarity allows creation",
+			results: []compreface.RecognitionResult{weakTarget},
+			status:  rpc.FaceUnmatched,
+		},
+		{
+			// The crop shows only the neighbour: creating would enroll it as a duplicate
+			name:    "only neighbour detected blocks creation",
+			results: []compreface.RecognitionResult{neighbour},
+			status:  rpc.FaceMisaligned,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			match, status := rpc.ClassifyRecognition(tt.results, expected, 0.81)
+			assert.Equal(t, tt.status, status)
+			if tt.expected == "" {
+				assert.Nil(t, match)
+				return
+			}
+			if assert.NotNil(t, match) {
+				assert.Equal(t, tt.expected, match.Subject)
+			}
+		})
+	}
+}
@@ -0,0 +1,112 @@
+package rpc_test
+
+import (
+	"image"
+	"image/color"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+
+	"github.com/smegmarip/stash-compreface-plugin/internal/rpc"
+)
+
+// newTestImage creates a w x h image where every pixel has a unique color
+func newTestImage(w, h int) *image.RGBA {
+	img := image.NewRGBA(image.Rect(0, 0, w, h))
+	for y := 0; y < h; y++ {
+		for x := 0; x < w; x++ {
+			img.Set(x, y, color.RGBA{R: uint8(x), G: uint8(y), B: 0, A: 255})
+		}
+	}
+	return img
+}
+
+func rgbaAt(img image.Image, x, y int) color.RGBA {
+	return color.RGBAModel.Convert(img.At(x, y)).(color.RGBA)
+}
+
+func TestOrientedImage_Bounds(t *testing.T) {
+	src := newTestImage(4, 3)
+
+	for orientation := 1; orientation <= 8; orientation++ {
+		oriented := &rpc.OrientedImage{Source: src, Orientation: orientation}
+		if orientation >= 5 {
+			assert.Equal(t, image.Rect(0, 0, 3, 4), oriented.Bounds(), "orientation %d should swap dimensions", orientation)
+		} else {
+			assert.Equal(t, image.Rect(0, 0, 4, 3), oriented.Bounds(), "orientation %d should keep dimensions", orientation)
+		}
+	}
+}
+
+func TestOrientedImage_CornerMapping(t *testing.T) {
+	src := newTestImage(4, 3)
+	topLeft := rgbaAt(src, 0, 0)
+
+	tests := []struct {
+		name        string
+		orientation int
+		x, y        int // expected oriented position of the source top-left pixel
+	}{
+		{"Normal", 1, 0, 0},
+		{"Flip horizontal", 2, 3, 0},
+		{"Rotate 180", 3, 3, 2},
+		{"Flip vertical", 4, 0, 2},
+		{"Transpose", 5, 0, 0},
+		{"Rotate 90 CW", 6, 2, 0},
+		{"Transverse", 7, 2, 3},
+		{"Rotate 270 CW", 8, 0, 3},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			oriented := &rpc.OrientedImage{Source: src, Orientation: tt.orientation}
+			assert.Equal(t, topLeft, rgbaAt(oriented, tt.x, tt.y))
+
+			full := oriented.SubImage(oriented.Bounds())
+			b := full.Bounds()
+			assert.Equal(t, topLeft, rgbaAt(full, b.Min.X+tt.x, b.Min.Y+tt.y))
+		})
+	}
+}
+
+func TestOrientedImage_SubImageMatchesFullImage(t *testing.T) {
+	src := newTestImage(7, 5)
+	roi := image.Rect(1, 2, 4, 5)
+
+	for orientation := 1; orientation <= 8; orientation++ {
+		oriented := &rpc.OrientedImage{Source: src, Orientation: orientation}
+		crop := oriented.SubImage(roi)
+		cb := crop.Bounds()
+
+		assert.Equal(t, roi.Dx(), cb.Dx(), "orientation %d crop width", orientation)
+		assert.Equal(t, roi.Dy(), cb.Dy(), "orientation %d crop height", orientation)
+
+		for y := 0; y < roi.Dy(); y++ {
+			for x := 0; x < roi.Dx(); x++ {
+				expected := rgbaAt(oriented, roi.Min.X+x, roi.Min.Y+y)
+				actual := rgbaAt(crop, cb.Min.X+x, cb.Min.Y+y)
+				assert.Equal(t, expected, actual, "orientation %d pixel (%d,%d)", orientation, x, y)
+			}
+		}
+	}
+}
+
+func TestOrientedImage_SubImageOffsetSource(t *testing.T) {
+	// Source whose bounds do not start at the origin
+	src := newTestImage(9, 7).SubImage(image.Rect(1, 2, 8, 7))
+	roi := image.Rect(0, 1, 3, 4)
+
+	for orientation := 1; orientation <= 8; orientation++ {
+		oriented := &rpc.OrientedImage{Source: src, Orientation: orientation}
+		crop := oriented.SubImage(roi)
+		cb := crop.Bounds()
+
+		for y := 0; y < roi.Dy(); y++ {
+			for x := 0; x < roi.Dx(); x++ {
+				expected := rgbaAt(oriented, roi.Min.X+x, roi.Min.Y+y)
+				actual := rgbaAt(crop, cb.Min.X+x, cb.Min.Y+y)
+				assert.Equal(t, expected, actual, "orientation %d pixel (%d,%d)", orientation, x, y)
+			}
+		}
+	}
+}
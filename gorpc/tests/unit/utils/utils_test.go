@@ -200,3 +200,106 @@ func TestDeduplicateIDs(t *testing.T) {
 		})
 	}
 }
+
+func TestScaleBoundingBox(t *testing.T) {
+	tests := []struct {
+		name     string
+		box      compreface.BoundingBox
+		scaleX   float64
+		scaleY   float64
+		expected compreface.BoundingBox
+	}{
+		{
+			name:     "Identity scale",
+			box:      compreface.BoundingBox{XMin: 10, YMin: 20, XMax: 110, YMax: 220, Probability: 0.9},
+			scaleX:   1,
+			scaleY:   1,
+			expected: compreface.BoundingBox{XMin: 10, YMin: 20, XMax: 110, YMax: 220, Probability: 0.9},
+		},
+		{
+			name:     "Uniform upscale",
+			box:      compreface.BoundingBox{XMin: 10, YMin: 20, XMax: 110, YMax: 220, Probability: 0.5},
+			scaleX:   2,
+			scaleY:   2,
+			expected: compreface.BoundingBox{XMin: 20, YMin: 40, XMax: 220, YMax: 440, Probability: 0.5},
+		},
+		{
+			name:     "Independent axes with rounding",
+			box:      compreface.BoundingBox{XMin: 3, YMin: 3, XMax: 7, YMax: 7},
+			scaleX:   1.5,
+			scaleY:   2.1,
+			expected: compreface.BoundingBox{XMin: 5, YMin: 6, XMax: 11, YMax: 15},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result := utils.ScaleBoundingBox(tt.box, tt.scaleX, tt.scaleY)
+			assert.Equal(t, tt.expected, result)
+		})
+	}
+}
+
+func TestIoU(t *testing.T) {
+	tests := []struct {
+		name     string
+		a        compreface.BoundingBox
+		b        compreface.BoundingBox
+		expected float64
+	}{
+		{
+			name:     "Identical boxes",
+			a:        compreface.BoundingBox{XMin: 0, YMin: 0, XMax: 10, YMax: 10},
+			b:        compreface.BoundingBox{XMin: 0, YMin: 0, XMax: 10, YMax: 10},
+			expected: 1.0,
+		},
+		{
+			name:     "Disjoint boxes",
+			a:        compreface.BoundingBox{XMin: 0, YMin: 0, XMax: 10, YMax: 10},
+			b:        compreface.BoundingBox{XMin: 20, YMin: 20, XMax: 30, YMax: 30},
+			expected: 0.0,
+		},
+		{
+			name:     "Touching edges",
+			a:        compreface.BoundingBox{XMin: 0, YMin: 0, XMax: 10, YMax: 10},
+			b:        compreface.BoundingBox{XMin: 10, YMin: 0, XMax: 20, YMax: 10},
+			expected: 0.0,
+		},
+		{
+			name:     "Half overlap",
+			a:        compreface.BoundingBox{XMin: 0, YMin: 0, XMax: 10, YMax: 10},
+			b:        compreface.BoundingBox{XMin: 5, YMin: 0, XMax: 15, YMax: 10},
+			expected: 50.0 / 150.0,
+		},
+		{
+			name:     "Contained box",
+			a:        compreface.BoundingBox{XMin: 0, YMin: 0, XMax: 10, YMax: 10},
+			b:        compreface.BoundingBox{XMin: 2, YMin: 2, XMax: 7, YMax: 7},
+			expected: 25.0 / 100.0,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			assert.InDelta(t, tt.expected, utils.IoU(tt.a, tt.b), 1e-9)
+			assert.InDelta(t, tt.expected, utils.IoU(tt.b, tt.a), 1e-9, "IoU should be symmetric")
+		})
+	}
+}
+
+func BenchmarkIoU(b *testing.B) {
+	target := compreface.BoundingBox{XMin: 40, YMin: 40, XMax: 168, YMax: 168}
+	boxes := []compreface.BoundingBox{
+		{XMin: 0, YMin: 0, XMax: 32, YMax: 32},
+		{XMin: 30, YMin: 35, XMax: 160, YMax: 170},
+		{XMin: 150, YMin: 10, XMax: 260, YMax: 120},
+		{XMin: 200, YMin: 200, XMax: 300, YMax: 300},
+	}
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		for _, box := range boxes {
+			_ = utils.IoU(target, box)
+		}
+	}
+}